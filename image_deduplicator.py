@@ -11,20 +11,52 @@ import os
 import sys
 import argparse
 import hashlib
+import functools
 from pathlib import Path
-from collections import defaultdict
-from typing import List, Dict, Tuple, Set
+from collections import defaultdict, OrderedDict
+from typing import List, Dict, Tuple, Set, Optional
 import json
+import io
+import csv
+import datetime
+import sqlite3
 import time
+import platform
+import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 
 try:
-    from PIL import Image
-    import imagehash
+    from PIL import Image, PngImagePlugin
+    import numpy as np
 except ImportError as e:
     print("Error: Required libraries not installed.")
-    print("Please run: pip install Pillow imagehash")
+    print("Please run: pip install Pillow numpy")
     sys.exit(1)
 
+# Optional fast non-cryptographic hash for exact-duplicate detection
+try:
+    import xxhash
+    EXACT_HASH = xxhash.xxh3_128
+except ImportError:
+    # BLAKE2b is faster than MD5 on 64-bit CPUs; a 128-bit digest is
+    # plenty for telling files apart
+    EXACT_HASH = functools.partial(hashlib.blake2b, digest_size=16)
+
+# Optional fast JSON encoder for saved results and exports
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional OpenCV backend for decoding and shrinking images before hashing
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+
 # GUI imports (only imported when needed)
 GUI_AVAILABLE = True
 try:
@@ -46,21 +78,252 @@ except ImportError:
     TB_AVAILABLE = False
 
 
+# Read size used when streaming whole files (1 MiB keeps syscall count low
+# without holding large images in memory)
+READ_CHUNK_SIZE = 1024 * 1024
+
+# Buffer for report files written row by row: large reports reach the disk
+# in 1 MiB writes instead of the default 8 KiB ones
+REPORT_WRITE_BUFFER = 1024 * 1024
+
+# Below this many files, hashing runs on threads; process start-up would cost
+# more than it saves
+PROCESS_POOL_MIN_FILES = 50
+
+# Directory listings are I/O-bound and release the GIL, so the walk can keep
+# many of them in flight (helps most on network shares)
+SCAN_WORKERS = 32
+
+# Bytes read from each end of a file for the quick exact-duplicate prefilter
+QUICK_HASH_BYTES = 4096
+
+# Files up to this size are read into memory once for both the content hash
+# and the image decode; larger ones are streamed and decoded from disk
+IN_MEMORY_MAX_BYTES = 50 * 1024 * 1024
+
+# Files handed to a hashing worker per task; also the average-hash batch size
+HASH_BATCH_SIZE = 32
+
+# Thumbnail sizes the average and difference hashes reduce images to (64 bits
+# each; dhash compares horizontal neighbours, hence the extra column)
+AHASH_SIZE = (8, 8)
+DHASH_SIZE = (9, 8)
+
+# Smallest size JPEGs are decoded at before hashing. libjpeg scales by at most
+# 1/8, so multi-megapixel photos still get the full saving; keeping this well
+# above the hash sizes stops small images' hashes drifting from their
+# full-resolution (e.g. PNG copy) counterparts
+HASH_DRAFT_SIZE = (64, 64)
+
+# Most GUI progress messages sent per scan; results can arrive thousands per
+# second and each message costs a Tk redraw
+PROGRESS_STEPS = 200
+
+# Images found between "Finding images..." status updates during the walk,
+# and the speed (ms per step) of the progress bar animation meanwhile
+WALK_PROGRESS_STEP = 500
+WALK_ANIMATION_MS = 20
+
+# Fallback interval for draining the worker message queue; normally each
+# message wakes the GUI through a <<QueueMessage>> event
+QUEUE_SAFETY_POLL_MS = 500
+
+# Visual-review thumbnails kept alive across group switches; older ones are
+# released so Tk's image registry doesn't grow with every group viewed
+THUMB_CACHE_SIZE = 64
+
+# Background threads decoding visual-review thumbnails
+THUMB_WORKERS = 4
+
+# Comparison-window previews (PIL images per file and size) kept so zoom,
+# view-mode and post-delete refreshes don't decode the files again
+PREVIEW_CACHE_SIZE = 32
+
+# Box of a comparison preview at 1.0x zoom; only this size is also kept in
+# the on-disk thumbnail cache (other zoom levels vary continuously)
+PREVIEW_SIZE = 300
+
+# Comparison views of larger groups only build the image widgets near the
+# visible part of the canvas (see _create_windowed_cells)
+COMPARISON_EAGER_FILES = 12
+
+# Display-sized image pairs kept per comparison window for the overlay and
+# difference views, so switching between recent pairs doesn't decode again
+OVERLAY_CACHE_SIZE = 4
+
+# Shortest interval (ms) between overlay re-renders while the opacity slider
+# moves; roughly one per frame at 60 Hz
+OVERLAY_REFRESH_MS = 16
+
+# Pause (ms) in zoom-slider movement before the comparison view is rebuilt;
+# every zoom level decodes all previews again, so only settled values count
+ZOOM_SETTLE_MS = 100
+
+# EXIF fields shown in the comparison window as (IFD, tag id, label); IFD
+# None is the main image directory, 0x8769 the Exif sub-directory
+EXIF_IFD = 0x8769
+EXIF_FIELDS = (
+    (None, 0x010F, 'Image Make'),
+    (None, 0x0110, 'Image Model'),
+    (EXIF_IFD, 0x829D, 'EXIF FNumber'),
+    (EXIF_IFD, 0x829A, 'EXIF ExposureTime'),
+    (EXIF_IFD, 0x8827, 'EXIF ISOSpeedRatings'),
+)
+
+# Host OS, resolved once; selects the file-manager/viewer commands below
+_SYSTEM = platform.system()
+
+
+# Per-user cache directory: the persistent hash cache (--cache) and the
+# visual-review thumbnail cache
+CACHE_DIR = Path.home() / '.cache' / 'image-dedup'
+HASH_CACHE_PATH = CACHE_DIR / 'hashes.db'
+THUMB_CACHE_DIR = CACHE_DIR / 'thumbs'
+
+# Thumbnail cache entries (visual-review thumbnails and default-zoom
+# comparison previews) unused for this long are removed at GUI startup,
+# then the least recently used until the rest fit in the byte cap
+THUMB_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+THUMB_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Cache rows written per transaction
+HASH_CACHE_BATCH = 1000
+
+
+class HashCache:
+    """
+    Persistent store of per-file hashes so repeat scans skip unchanged files.
+    
+    Rows are keyed by path and only trusted while the file's size and
+    mtime still match. The key is the path rather than (st_dev, st_ino)
+    because DirEntry.stat() leaves those zero on Windows.
+    """
+    
+    def __init__(self, db_path: Path, hash_method: str):
+        """
+        Open (creating if needed) the cache database.
+        
+        Args:
+            db_path: SQLite database file
+            hash_method: Identifies how hashes were computed (content hash
+                and decode backend); rows from another method are ignored
+        """
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.hash_method = hash_method
+        self.connection = sqlite3.connect(str(db_path))
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS hashes (
+                path TEXT PRIMARY KEY,
+                size INTEGER,
+                mtime_ns INTEGER,
+                method TEXT,
+                file_hash TEXT,
+                average_hash TEXT,
+                difference_hash TEXT,
+                width INTEGER,
+                height INTEGER,
+                format TEXT,
+                mode TEXT
+            )
+        """)
+        self.pending = []
+    
+    def get(self, file_path: Path, stat: os.stat_result
+            ) -> Optional[Tuple[Optional[str], Optional[Tuple[int, int]], Optional[Dict]]]:
+        """Return (file_hash, perceptual_hash, details) for an unchanged file, or None."""
+        row = self.connection.execute(
+            "SELECT size, mtime_ns, method, file_hash, average_hash, difference_hash,"
+            " width, height, format, mode FROM hashes WHERE path = ?",
+            (str(file_path),)
+        ).fetchone()
+        if (row is None or row[0] != stat.st_size or row[1] != stat.st_mtime_ns
+                or row[2] != self.hash_method):
+            return None
+        perceptual_hash = (int(row[4], 16), int(row[5], 16)) if row[4] else None
+        details = None
+        if row[6] is not None:
+            details = {'width': row[6], 'height': row[7], 'format': row[8], 'mode': row[9]}
+        return row[3], perceptual_hash, details
+    
+    def put(self, file_path: Path, stat: os.stat_result, file_hash: str,
+            perceptual_hash: Tuple[int, int], details: Dict):
+        """Queue a file's hashes for storage; written in batches."""
+        # Stored as hex text: 64-bit hashes overflow SQLite's signed INTEGER
+        average_hash, difference_hash = (f"{h:016x}" for h in perceptual_hash)
+        details = details or {}
+        self.pending.append((
+            str(file_path), stat.st_size, stat.st_mtime_ns, self.hash_method,
+            file_hash, average_hash, difference_hash,
+            details.get('width'), details.get('height'), details.get('format'), details.get('mode')
+        ))
+        if len(self.pending) >= HASH_CACHE_BATCH:
+            self.flush()
+    
+    def flush(self):
+        """Write queued rows in a single transaction."""
+        if not self.pending:
+            return
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                self.pending
+            )
+        self.pending = []
+    
+    def prune(self, directory: Path, seen: List[Path]):
+        """Drop rows for files under directory that are not in seen (deleted or moved)."""
+        # Compared as a path prefix in SQL rather than with LIKE, which
+        # would treat '%' and '_' in directory names as wildcards
+        prefix = os.path.join(str(directory), '')
+        seen = {str(file_path) for file_path in seen}
+        rows = self.connection.execute(
+            "SELECT path FROM hashes WHERE substr(path, 1, ?) = ?", (len(prefix), prefix))
+        stale = [(path,) for (path,) in rows if path not in seen]
+        if stale:
+            with self.connection:
+                self.connection.executemany("DELETE FROM hashes WHERE path = ?", stale)
+    
+    def close(self):
+        """Write any queued rows and close the database."""
+        self.flush()
+        self.connection.close()
+
+
 class ImageDeduplicator:
     """Main class for image deduplication functionality."""
     
-    def __init__(self, threshold: int = 5, dry_run: bool = True):
+    def __init__(self, threshold: int = 5, dry_run: bool = True, workers: int = None,
+                 use_opencv: bool = False, cache_path: Path = None):
         """
         Initialize the deduplicator.
         
         Args:
             threshold: Hash difference threshold for considering images similar (0-64)
             dry_run: If True, don't actually delete files
+            workers: Number of parallel hashing workers (None for CPU count)
+            use_opencv: Decode images with OpenCV when it is installed
+            cache_path: SQLite file to reuse hashes from across runs (None to disable)
         """
         self.threshold = threshold
         self.dry_run = dry_run
-        self.supported_formats = {'.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff', '.webp'}
+        self.workers = workers or os.cpu_count() or 1
+        self.use_opencv = use_opencv and CV2_AVAILABLE
+        self.hash_cache = None
+        if cache_path:
+            try:
+                hash_method = f"{EXACT_HASH().name}/{'opencv' if self.use_opencv else 'pil'}"
+                self.hash_cache = HashCache(Path(cache_path), hash_method)
+            except (sqlite3.Error, OSError) as e:
+                print(f"Warning: hash cache unavailable ({e}); hashing every file.")
+        # A tuple so a single str.endswith call can test every extension
+        self.supported_formats = ('.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff', '.webp')
         self.duplicates = []
+        # stat() results captured during the directory walk, keyed by path
+        self._stat_cache: Dict[Path, os.stat_result] = {}
+        # Width/height/format/mode captured while hashing, keyed by path
+        self._details_cache: Dict[Path, Dict] = {}
         self.stats = {
             'total_files': 0,
             'processed_files': 0,
@@ -71,47 +334,340 @@ class ImageDeduplicator:
     
     def is_image_file(self, file_path: Path) -> bool:
         """Check if file is a supported image format."""
-        return file_path.suffix.lower() in self.supported_formats
+        return file_path.name.lower().endswith(self.supported_formats)
+    
+    def collect_image_files(self, directory_path: Path, progress=None) -> List[Path]:
+        """
+        Collect all supported image files below a directory.
+        
+        Args:
+            directory_path: Directory to walk
+            progress: Optional callback, given the number of images found so
+                far each time a directory listing completes
+        """
+        image_files = []
+        self._stat_cache = {}
+        self._details_cache = {}
+        
+        # Breadth-first walk: every finished listing submits its
+        # subdirectories, so sibling directories are read concurrently
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+            pending = {executor.submit(self._scan_directory, str(directory_path))}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, subdirectories = future.result()
+                    for file_path, stat in files:
+                        image_files.append(file_path)
+                        self._stat_cache[file_path] = stat
+                    pending.update(executor.submit(self._scan_directory, subdirectory)
+                                   for subdirectory in subdirectories)
+                if progress:
+                    progress(len(image_files))
+        
+        # Completion order is arbitrary; keep scans deterministic
+        image_files.sort()
+        return image_files
     
-    def get_file_hash(self, file_path: Path) -> str:
-        """Get MD5 hash of file for exact duplicates."""
-        hash_md5 = hashlib.md5()
+    def _scan_directory(self, directory: str) -> Tuple[List[Tuple[Path, os.stat_result]], List[str]]:
+        """List one directory, returning its image files (with stats) and subdirectories."""
+        files = []
+        subdirectories = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        # Like rglob, don't descend into symlinked directories
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirectories.append(entry.path)
+                        else:
+                            # Check the extension on the bare name first so
+                            # non-image entries never need a Path or a stat call
+                            if (entry.name.lower().endswith(self.supported_formats)
+                                    and entry.is_file()):
+                                files.append((Path(entry.path), entry.stat()))
+                    except OSError:
+                        continue
+        except OSError:
+            pass  # Unreadable directory; skip it as rglob does
+        return files, subdirectories
+    
+    @staticmethod
+    def get_file_hash(file_path: Path) -> str:
+        """Get content hash of file for exact duplicates (xxHash, or BLAKE2b without it)."""
         try:
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+                # file_digest (Python 3.11+) runs the read/update loop in C
+                if hasattr(hashlib, 'file_digest'):
+                    return hashlib.file_digest(f, EXACT_HASH).hexdigest()
+                hasher = EXACT_HASH()
+                for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), b""):
+                    hasher.update(chunk)
+            return hasher.hexdigest()
         except (IOError, OSError):
             return None
     
-    def get_perceptual_hash(self, file_path: Path) -> str:
-        """Get perceptual hash of image for similar images."""
+    @staticmethod
+    def get_quick_hash(file_path: Path) -> Optional[str]:
+        """Hash the first and last QUICK_HASH_BYTES of a file, as a prefilter for exact matches."""
         try:
-            with Image.open(file_path) as img:
-                # Convert to RGB if necessary
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                return str(imagehash.average_hash(img))
-        except (IOError, OSError, Exception):
+            with open(file_path, "rb") as f:
+                hasher = EXACT_HASH(f.read(QUICK_HASH_BYTES))
+                end = f.seek(0, os.SEEK_END)
+                if end > QUICK_HASH_BYTES:
+                    f.seek(max(end - QUICK_HASH_BYTES, QUICK_HASH_BYTES))
+                    hasher.update(f.read(QUICK_HASH_BYTES))
+            return hasher.hexdigest()
+        except (IOError, OSError):
             return None
     
-    def get_image_info(self, file_path: Path) -> Dict:
-        """Get comprehensive image information."""
+    @staticmethod
+    def get_perceptual_hash(file_path: Path, use_opencv: bool = False) -> Tuple[int, int]:
+        """Get (average hash, difference hash) of image for similar images."""
+        return ImageDeduplicator.batch_perceptual_hash([file_path], use_opencv)[0]
+    
+    @staticmethod
+    def batch_perceptual_hash(file_paths: List[Path], use_opencv: bool = False) -> List[Tuple[int, int]]:
+        """Get (average hash, difference hash) for a batch of images, None for unreadable files."""
+        return [result and result[0]
+                for result in ImageDeduplicator.batch_analyse_images(file_paths, use_opencv)]
+    
+    @staticmethod
+    def batch_analyse_images(sources: List, use_opencv: bool = False) -> List[Tuple[Tuple[int, int], Dict]]:
+        """
+        Hash and describe a batch of images, decoding each one once.
+        
+        Average and difference hashes are thresholded for the whole batch in
+        single vectorised steps. The average hash is the cheap bucket key; the
+        difference hash is far more discriminating and is what similarity
+        within a bucket is judged on. Both are 64-bit ints computed like
+        imagehash.average_hash/dhash (JPEGs are decoded at reduced scale
+        first, so their bits can differ slightly).
+        
+        Args:
+            sources: Image paths, or in-memory file objects already read
+            use_opencv: Decode and resize with OpenCV, falling back to PIL
+                for files it cannot read (GIFs, unusual encodings)
+            
+        Returns:
+            ((average_hash, difference_hash), details) per source, None for
+            sources that could not be read. details holds width, height,
+            format and mode, or is None when OpenCV did the decoding.
+        """
+        return ImageDeduplicator._pack_hashes(
+            [ImageDeduplicator._decode_hash_thumbnails(source, use_opencv) for source in sources])
+    
+    @staticmethod
+    def _decode_hash_thumbnails(source, use_opencv: bool = False) -> Optional[Tuple]:
+        """
+        Decode one image to the tiny grayscale reductions both hashes use.
+        
+        Returns:
+            (average_thumb, difference_thumb, details), or None if the source
+            could not be read (see batch_analyse_images for details)
+        """
         try:
-            stat = file_path.stat()
-            with Image.open(file_path) as img:
-                return {
-                    'path': str(file_path),
-                    'size': stat.st_size,
+            gray = _decode_grayscale_opencv(source) if use_opencv else None
+            if gray is not None:
+                average_thumb = cv2.resize(gray, AHASH_SIZE, interpolation=cv2.INTER_AREA)
+                difference_thumb = cv2.resize(gray, DHASH_SIZE, interpolation=cv2.INTER_AREA)
+                return average_thumb, difference_thumb, None
+            with Image.open(source) as img:
+                details = {
                     'width': img.width,
                     'height': img.height,
                     'format': img.format,
-                    'mode': img.mode,
-                    'modified': stat.st_mtime
+                    'mode': img.mode
                 }
+                # Both hashes only look at tiny grayscale reductions,
+                # so let libjpeg decode at reduced scale (no-op for
+                # other formats) and go straight to 'L' rather than
+                # through RGB. Recorded above: draft changes size/mode.
+                img.draft('L', HASH_DRAFT_SIZE)
+                gray = img.convert('L')
+                average_thumb = np.asarray(gray.resize(AHASH_SIZE, Image.Resampling.LANCZOS))
+                difference_thumb = np.asarray(gray.resize(DHASH_SIZE, Image.Resampling.LANCZOS))
+                return average_thumb, difference_thumb, details
+        except (OSError, ValueError, Image.DecompressionBombError):
+            return None
+    
+    @staticmethod
+    def _pack_hashes(decoded: List[Optional[Tuple]]) -> List[Tuple[Tuple[int, int], Dict]]:
+        """Threshold decoded thumbnails (see _decode_hash_thumbnails) into hashes in one vectorised pass."""
+        results = [None] * len(decoded)
+        described = [(index, entry) for index, entry in enumerate(decoded) if entry is not None]
+        if described:
+            count = len(described)
+            stack = np.stack([entry[0] for _, entry in described])
+            average_bits = stack > stack.mean(axis=(1, 2), keepdims=True)
+            stack = np.stack([entry[1] for _, entry in described])
+            difference_bits = stack[:, :, 1:] > stack[:, :, :-1]
+            average_packed = np.packbits(average_bits.reshape(count, -1), axis=1)
+            difference_packed = np.packbits(difference_bits.reshape(count, -1), axis=1)
+            for (index, entry), average_row, difference_row in zip(described, average_packed, difference_packed):
+                results[index] = ((int.from_bytes(average_row.tobytes(), 'big'),
+                                   int.from_bytes(difference_row.tobytes(), 'big')), entry[2])
+        return results
+    
+    def _get_stat(self, file_path: Path) -> os.stat_result:
+        """Stat a file, reusing the result captured during the directory walk."""
+        return self._stat_cache.get(file_path) or file_path.stat()
+    
+    def get_image_info(self, file_path: Path) -> Dict:
+        """Get comprehensive image information."""
+        try:
+            stat = self._get_stat(file_path)
+            # Dimensions/format were usually captured while hashing; only
+            # reopen the image when they weren't
+            details = self._details_cache.get(file_path)
+            if details is None:
+                with Image.open(file_path) as img:
+                    details = {
+                        'width': img.width,
+                        'height': img.height,
+                        'format': img.format,
+                        'mode': img.mode
+                    }
+            return {
+                'path': str(file_path),
+                'size': stat.st_size,
+                'width': details['width'],
+                'height': details['height'],
+                'format': details['format'],
+                'mode': details['mode'],
+                'modified': stat.st_mtime
+            }
         except (IOError, OSError, Exception):
             return None
     
+    def get_exact_candidates(self, image_files: List[Path]) -> Set[Path]:
+        """Return the files that share their size and head/tail bytes with another file."""
+        # Files with a unique size cannot be byte-identical to anything, so
+        # they never need a full-content hash
+        size_buckets = defaultdict(list)
+        for file_path in image_files:
+            try:
+                size_buckets[self._get_stat(file_path).st_size].append(file_path)
+            except OSError:
+                size_buckets[None].append(file_path)
+        
+        candidates = set(size_buckets.pop(None, []))
+        same_size = [file_path for files in size_buckets.values() if len(files) > 1
+                     for file_path in files]
+        
+        # Equal sizes are common (fixed-resolution exports, camera bursts);
+        # a quick hash of each file's ends rules most of those out before
+        # anything reads the whole file
+        quick_buckets = defaultdict(list)
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+            for file_path, quick_hash in zip(same_size, executor.map(self.get_quick_hash, same_size)):
+                quick_buckets[(self._get_stat(file_path).st_size, quick_hash)].append(file_path)
+        
+        for (size, quick_hash), files in quick_buckets.items():
+            if len(files) > 1 or quick_hash is None:
+                candidates.update(files)
+        return candidates
+    
+    def hash_files(self, image_files: List[Path], exact_candidates: Set[Path] = None):
+        """
+        Compute exact and perceptual hashes for a list of files in parallel.
+        
+        Args:
+            image_files: Files to hash
+            exact_candidates: Files that need a file hash (None for all)
+        
+        Yields:
+            (file_path, file_hash, perceptual_hash, details) tuples as they
+            complete (cached files first); file_hash is None for files
+            outside exact_candidates,
+            perceptual_hash is an (average, difference) hash pair and details
+            the image dimensions/format (see batch_analyse_images)
+        """
+        if exact_candidates is None:
+            exact_candidates = set(image_files)
+        
+        # Put same-size candidates next to each other so copies of a file
+        # tend to land in one batch, where _hash_images decodes them once
+        def batch_order(file_path):
+            if file_path not in exact_candidates:
+                return (1, 0)
+            try:
+                return (0, self._get_stat(file_path).st_size)
+            except OSError:
+                return (0, -1)
+        
+        image_files = sorted(image_files, key=batch_order)
+        needs_file_hash = [file_path in exact_candidates for file_path in image_files]
+        
+        if not self.hash_cache:
+            yield from self._hash_uncached(image_files, needs_file_hash)
+            return
+        
+        # Serve unchanged files straight from the cache, then hash the rest
+        stats = {}
+        misses = []
+        miss_flags = []
+        for file_path, needs_hash in zip(image_files, needs_file_hash):
+            try:
+                stats[file_path] = self._get_stat(file_path)
+            except OSError:
+                stats[file_path] = None
+            hit = stats[file_path] and self.hash_cache.get(file_path, stats[file_path])
+            # A row hashed when the file had no same-size twin lacks a file hash
+            if hit and (hit[0] or not needs_hash):
+                file_hash, perceptual_hash, details = hit
+                yield (file_path, file_hash if needs_hash else None, perceptual_hash, details)
+            else:
+                misses.append(file_path)
+                miss_flags.append(needs_hash)
+        
+        fresh = self._hash_uncached(misses, miss_flags)
+        try:
+            for result in fresh:
+                file_path = result[0]
+                if stats[file_path] and result[2]:
+                    self.hash_cache.put(file_path, stats[file_path], *result[1:])
+                yield result
+        finally:
+            fresh.close()
+            self.hash_cache.flush()
+    
+    def _hash_uncached(self, image_files: List[Path], needs_file_hash: List[bool]):
+        """Hash files on the worker pool; see hash_files."""
+        file_batches = [image_files[i:i + HASH_BATCH_SIZE]
+                        for i in range(0, len(image_files), HASH_BATCH_SIZE)]
+        flag_batches = [needs_file_hash[i:i + HASH_BATCH_SIZE]
+                        for i in range(0, len(needs_file_hash), HASH_BATCH_SIZE)]
+        backends = [self.use_opencv] * len(file_batches)
+        
+        if self.workers <= 1:
+            for results in map(_hash_images, file_batches, flag_batches, backends):
+                yield from results
+            return
+        
+        if len(image_files) < PROCESS_POOL_MIN_FILES:
+            executor = ThreadPoolExecutor(max_workers=self.workers)
+        else:
+            # Spawn rather than fork: the GUI starts scans from a worker
+            # thread while Tk and the thumbnail threads may hold locks, and
+            # a forked child would inherit them held. _hash_images is
+            # module-level, so spawned workers can import it
+            executor = ProcessPoolExecutor(max_workers=self.workers,
+                                           mp_context=multiprocessing.get_context('spawn'))
+        with executor:
+            futures = [executor.submit(_hash_images, files, flags, backend)
+                       for files, flags, backend in zip(file_batches, flag_batches, backends)]
+            try:
+                # Take batches as they finish so one slow file doesn't hold
+                # back results (and progress) from the batches behind it
+                for future in as_completed(futures):
+                    yield from future.result()
+            finally:
+                # If the caller stops early, cancel batches that haven't
+                # started before the pool shutdown waits on them
+                for future in futures:
+                    future.cancel()
+    
     def find_duplicates(self, directory: str) -> List[Dict]:
         """
         Find duplicate images in the specified directory.
@@ -129,10 +685,7 @@ class ImageDeduplicator:
         print(f"Scanning directory: {directory_path}")
         
         # Collect all image files
-        image_files = []
-        for file_path in directory_path.rglob('*'):
-            if file_path.is_file() and self.is_image_file(file_path):
-                image_files.append(file_path)
+        image_files = self.collect_image_files(directory_path)
         
         self.stats['total_files'] = len(image_files)
         print(f"Found {len(image_files)} image files")
@@ -140,45 +693,97 @@ class ImageDeduplicator:
         if not image_files:
             return []
         
-        # Group by exact hash (identical files)
-        exact_duplicates = defaultdict(list)
-        perceptual_groups = defaultdict(list)
-        
         print("Processing images...")
-        for i, file_path in enumerate(image_files):
-            if i % 50 == 0:
-                print(f"Processed {i}/{len(image_files)} files...")
+        
+        def report_processed(processed, total):
+            if processed % 50 == 0:
+                print(f"Processed {processed}/{total} files...")
+        
+        return self.group_image_files(directory_path, image_files, progress=report_processed)
+    
+    def group_image_files(self, directory: Path, image_files: List[Path],
+                          progress=None) -> Optional[List[Dict]]:
+        """
+        Hash image files and group them into duplicate groups.
+        
+        Args:
+            directory: Directory the files were collected from; hash cache
+                rows for files under it that are no longer there are dropped
+            image_files: Files to compare, as returned by collect_image_files
+            progress: Optional callback(processed, total), called before each
+                hashed file is grouped; returning True cancels the scan
             
-            # Get file hash for exact duplicates
-            file_hash = self.get_file_hash(file_path)
+        Returns:
+            List of duplicate groups, or None if the scan was cancelled
+        """
+        # Group by exact hash (identical files). Each hash sits in a seen-once
+        # dict until a second file shares it, so the common unique file costs
+        # one dict slot instead of a single-element list
+        seen_exact, exact_duplicates = {}, {}
+        seen_perceptual, perceptual_groups = {}, {}
+        # Difference hash per file, compared within each bucket
+        phash_cache = {}
+        
+        exact_candidates = self.get_exact_candidates(image_files)
+        
+        hashed = self.hash_files(image_files, exact_candidates)
+        for i, (file_path, file_hash, perceptual_hash, details) in enumerate(hashed):
+            if progress and progress(i, len(image_files)):
+                hashed.close()  # Drops hashing work that hasn't started
+                return None
+            
+            # File hash for exact duplicates (only same-size files get one)
             if file_hash:
-                exact_duplicates[file_hash].append(file_path)
+                _bucket_add(seen_exact, exact_duplicates, file_hash, file_path)
             
-            # Get perceptual hash for similar images
-            perceptual_hash = self.get_perceptual_hash(file_path)
+            # Perceptual hashes for similar images: bucket on the average
+            # hash, judge similarity on the difference hash
             if perceptual_hash:
-                perceptual_groups[perceptual_hash].append(file_path)
+                average_hash, difference_hash = perceptual_hash
+                _bucket_add(seen_perceptual, perceptual_groups, average_hash, file_path)
+                phash_cache[file_path] = difference_hash
+            if details:
+                self._details_cache[file_path] = details
             
             self.stats['processed_files'] += 1
         
+        if self.hash_cache:
+            self.hash_cache.prune(directory, image_files)
+        return self._build_duplicate_groups(exact_duplicates, perceptual_groups, phash_cache)
+    
+    def close(self):
+        """Release the hash cache; call once done scanning."""
+        if self.hash_cache:
+            self.hash_cache.close()
+            self.hash_cache = None
+    
+    def _build_duplicate_groups(self, exact_duplicates: Dict[str, List[Path]],
+                                perceptual_groups: Dict[int, List[Path]],
+                                phash_cache: Dict[Path, int]) -> List[Dict]:
+        """Turn hash buckets (each holding two or more files) into duplicate
+        groups and update the statistics."""
+        # Hashes arrive in completion order; sort buckets and their files so
+        # group order, and which file is kept on a size tie, never depend on
+        # worker timing
+        exact_buckets = sorted(sorted(files) for files in exact_duplicates.values())
+        perceptual_buckets = sorted(sorted(files) for files in perceptual_groups.values())
+        
         # Process exact duplicates
         duplicate_groups = []
-        for file_hash, files in exact_duplicates.items():
-            if len(files) > 1:
-                group = self._create_duplicate_group(files, 'exact')
-                if group:
-                    duplicate_groups.append(group)
+        for files in exact_buckets:
+            group = self._create_duplicate_group(files, 'exact')
+            if group:
+                duplicate_groups.append(group)
         
         # Process perceptual duplicates
-        for perceptual_hash, files in perceptual_groups.items():
-            if len(files) > 1:
-                # Check similarity within the group
-                similar_groups = self._group_similar_images(files)
-                for group_files in similar_groups:
-                    if len(group_files) > 1:
-                        group = self._create_duplicate_group(group_files, 'similar')
-                        if group:
-                            duplicate_groups.append(group)
+        for files in perceptual_buckets:
+            # Check similarity within the group
+            similar_groups = self._group_similar_images(files, phash_cache)
+            for group_files in similar_groups:
+                if len(group_files) > 1:
+                    group = self._create_duplicate_group(group_files, 'similar')
+                    if group:
+                        duplicate_groups.append(group)
         
         self.duplicates = duplicate_groups
         self.stats['duplicate_groups'] = len(duplicate_groups)
@@ -186,44 +791,46 @@ class ImageDeduplicator:
         
         return duplicate_groups
     
-    def _group_similar_images(self, files: List[Path]) -> List[List[Path]]:
-        """Group similar images based on perceptual hash difference."""
+    def _group_similar_images(self, files: List[Path],
+                              phash_cache: Dict[Path, int]) -> List[List[Path]]:
+        """Group similar images based on difference-hash distance."""
+        files = [file_path for file_path in files if file_path in phash_cache]
         if len(files) < 2:
             return []
         
-        groups = []
-        used_files = set()
+        hashes = np.array([phash_cache[file_path] for file_path in files], dtype=np.uint64)
         
-        for i, file1 in enumerate(files):
-            if file1 in used_files:
-                continue
-            
-            current_group = [file1]
-            used_files.add(file1)
-            
-            hash1 = self.get_perceptual_hash(file1)
-            if not hash1:
-                continue
-            
-            for j, file2 in enumerate(files[i+1:], i+1):
-                if file2 in used_files:
-                    continue
-                
-                hash2 = self.get_perceptual_hash(file2)
-                if not hash2:
-                    continue
-                
-                # Calculate hamming distance
-                hamming_distance = imagehash.hex_to_hash(hash1) - imagehash.hex_to_hash(hash2)
-                
-                if hamming_distance <= self.threshold:
-                    current_group.append(file2)
-                    used_files.add(file2)
-            
-            if len(current_group) > 1:
-                groups.append(current_group)
+        # Most buckets are copies sharing one hash: every distance is 0, so the
+        # whole bucket is a single group and the pairwise pass can be skipped
+        if (hashes == hashes[0]).all():
+            return [files]
+        
+        # Compute every pairwise hamming distance at once: XOR all pairs,
+        # then popcount the results
+        distances = _popcount64(hashes[:, None] ^ hashes[None, :])
+        similar = distances <= self.threshold
+        
+        # Similar images form connected components of the thresholded graph,
+        # so A~B and B~C end up together even when A and C are further apart.
+        # Union-find over the matching pairs, with path halving.
+        parent = list(range(len(files)))
+        
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        for i, j in np.argwhere(np.triu(similar, k=1)):
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                parent[max(root_i, root_j)] = min(root_i, root_j)
         
-        return groups
+        components = defaultdict(list)
+        for i, file_path in enumerate(files):
+            components[find(i)].append(file_path)
+        
+        return [group for group in components.values() if len(group) > 1]
     
     def _create_duplicate_group(self, files: List[Path], duplicate_type: str) -> Dict:
         """Create a duplicate group with metadata."""
@@ -297,27 +904,32 @@ class ImageDeduplicator:
     
     def print_results(self):
         """Print duplicate detection results."""
-        print("\n" + "="*60)
-        print("DUPLICATE DETECTION RESULTS")
-        print("="*60)
-        
-        print(f"Total files scanned: {self.stats['total_files']}")
-        print(f"Files processed: {self.stats['processed_files']}")
-        print(f"Duplicate groups found: {self.stats['duplicate_groups']}")
-        print(f"Files that can be deleted: {self.stats['files_to_delete']}")
-        print(f"Space that can be saved: {self._format_size(self.stats['space_saved'])}")
+        # Collect the report and emit it with a single write instead of one
+        # console write per line
+        lines = [
+            "",
+            "="*60,
+            "DUPLICATE DETECTION RESULTS",
+            "="*60,
+            f"Total files scanned: {self.stats['total_files']}",
+            f"Files processed: {self.stats['processed_files']}",
+            f"Duplicate groups found: {self.stats['duplicate_groups']}",
+            f"Files that can be deleted: {self.stats['files_to_delete']}",
+            f"Space that can be saved: {self._format_size(self.stats['space_saved'])}",
+        ]
         
         if not self.duplicates:
-            print("\nNo duplicates found!")
-            return
+            lines.append("\nNo duplicates found!")
+        else:
+            lines.append(f"\nDuplicate Groups:")
+            for i, group in enumerate(self.duplicates):
+                lines.append(f"\nGroup {i+1} ({group['type']} duplicates):")
+                lines.append(f"  Keep: {group['keep']['path']} ({self._format_size(group['keep']['size'])})")
+                for file_info in group['delete']:
+                    lines.append(f"  Delete: {file_info['path']} ({self._format_size(file_info['size'])})")
+                lines.append(f"  Space saved: {self._format_size(group['space_saved'])}")
         
-        print(f"\nDuplicate Groups:")
-        for i, group in enumerate(self.duplicates):
-            print(f"\nGroup {i+1} ({group['type']} duplicates):")
-            print(f"  Keep: {group['keep']['path']} ({self._format_size(group['keep']['size'])})")
-            for file_info in group['delete']:
-                print(f"  Delete: {file_info['path']} ({self._format_size(file_info['size'])})")
-            print(f"  Space saved: {self._format_size(group['space_saved'])}")
+        print("\n".join(lines))
     
     def _format_size(self, size_bytes: int) -> str:
         """Format file size in human readable format."""
@@ -328,6 +940,195 @@ class ImageDeduplicator:
         return f"{size_bytes:.1f} TB"
 
 
+def _bucket_add(seen: Dict, buckets: Dict, key, file_path: Path):
+    """File file_path under key, promoting key from seen to buckets only
+    once a second file shares it."""
+    if key in buckets:
+        buckets[key].append(file_path)
+    elif key in seen:
+        buckets[key] = [seen.pop(key), file_path]
+    else:
+        seen[key] = file_path
+
+
+def _popcount64(values: np.ndarray) -> np.ndarray:
+    """Count the set bits of every element of a uint64 array."""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(values)  # NumPy 2.0+: one POPCNT per element
+    # SWAR fallback: add bits in pairs, then nibbles, then bytes; the
+    # multiply sums the eight byte counts into the top byte
+    values = values - ((values >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    values = (values & np.uint64(0x3333333333333333)) + ((values >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    values = (values + (values >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return (values * np.uint64(0x0101010101010101)) >> np.uint64(56)
+
+
+def _decode_grayscale_opencv(source):
+    """Decode an image path or BytesIO to an 8-bit grayscale array with OpenCV, or None if it can't."""
+    try:
+        # imdecode rather than imread so non-ASCII paths work on Windows;
+        # ignore EXIF orientation like the PIL path does
+        if isinstance(source, io.BytesIO):
+            data = np.frombuffer(source.getbuffer(), dtype=np.uint8)
+        else:
+            data = np.fromfile(str(source), dtype=np.uint8)
+        return cv2.imdecode(data, cv2.IMREAD_GRAYSCALE | cv2.IMREAD_IGNORE_ORIENTATION)
+    except Exception:
+        return None
+
+
+def _read_and_hash_file(file_path: Path) -> Tuple[Optional[str], Optional[bytes]]:
+    """
+    Content-hash a file, keeping its bytes when small enough to decode from memory.
+    
+    Returns:
+        (file_hash, data); data is None for files over IN_MEMORY_MAX_BYTES,
+        and both are None if the file can't be read
+    """
+    try:
+        with open(file_path, "rb") as f:
+            data = f.read(IN_MEMORY_MAX_BYTES + 1)
+            if len(data) <= IN_MEMORY_MAX_BYTES:
+                return EXACT_HASH(data).hexdigest(), data
+            # Too large to hold; stream the rest and let PIL re-read from disk
+            hasher = EXACT_HASH(data)
+            del data
+            for chunk in iter(lambda: f.read(READ_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest(), None
+    except (IOError, OSError):
+        return None, None
+
+
+def _hash_images(file_paths: List[Path], with_file_hash: List[bool], use_opencv: bool = False
+                 ) -> List[Tuple[Path, Optional[str], Optional[Tuple[int, int]], Optional[Dict]]]:
+    """Hash a batch of files; module-level so process pool workers can pickle it."""
+    # Files that need a content hash are read once: the same bytes feed the
+    # exact hash and the image decoder. Each file is decoded right after it
+    # is read, so a worker holds one file's bytes at a time, not a batch's
+    file_hashes = []
+    decoded = []
+    decoded_indices = []  # Position in decoded of each file's thumbnails
+    first_copy = {}
+    for file_path, needs_hash in zip(file_paths, with_file_hash):
+        file_hash, data = _read_and_hash_file(file_path) if needs_hash else (None, None)
+        file_hashes.append(file_hash)
+        # Byte-identical files have identical perceptual hashes, so only the
+        # first copy of each content in the batch is decoded
+        if file_hash is not None and file_hash in first_copy:
+            decoded_indices.append(first_copy[file_hash])
+            continue
+        if file_hash is not None:
+            first_copy[file_hash] = len(decoded)
+        decoded_indices.append(len(decoded))
+        source = io.BytesIO(data) if data is not None else file_path
+        decoded.append(ImageDeduplicator._decode_hash_thumbnails(source, use_opencv))
+    
+    analysed = ImageDeduplicator._pack_hashes(decoded)
+    results = [analysed[i] for i in decoded_indices]
+    return [(file_path, file_hash, result[0] if result else None, result[1] if result else None)
+            for file_path, file_hash, result in zip(file_paths, file_hashes, results)]
+
+
+def _write_json(data, file_path):
+    """Write data to file_path as indented JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, default=str,
+                                 option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(file_path, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
+
+
+# Attribution line shared by all exported reports
+REPORT_FOOTER = "Generated by Image Deduplicator - Enhanced UI/UX Edition"
+
+# Static <head> of the HTML report (markup and CSS never change between exports)
+_HTML_REPORT_HEAD = """
+        <!DOCTYPE html>
+        <html lang="en">
+        <head>
+            <meta charset="UTF-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <title>Image Deduplicator - Duplicate Group Report</title>
+            <style>
+                body {
+                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+                    margin: 40px;
+                    background-color: #f5f5f5;
+                    color: #333;
+                }
+                .container {
+                    max-width: 1200px;
+                    margin: 0 auto;
+                    background: white;
+                    padding: 30px;
+                    border-radius: 8px;
+                    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+                }
+                .header {
+                    text-align: center;
+                    margin-bottom: 30px;
+                    padding-bottom: 20px;
+                    border-bottom: 2px solid #007bff;
+                }
+                .info-grid {
+                    display: grid;
+                    grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+                    gap: 20px;
+                    margin-bottom: 30px;
+                }
+                .info-card {
+                    background: #f8f9fa;
+                    padding: 15px;
+                    border-radius: 5px;
+                    border-left: 4px solid #007bff;
+                }
+                table {
+                    width: 100%;
+                    border-collapse: collapse;
+                    margin: 20px 0;
+                }
+                th, td {
+                    padding: 12px;
+                    text-align: left;
+                    border-bottom: 1px solid #ddd;
+                }
+                th {
+                    background-color: #007bff;
+                    color: white;
+                    font-weight: bold;
+                }
+                tr:hover {
+                    background-color: #f5f5f5;
+                }
+                .keep {
+                    background-color: #d4edda !important;
+                    color: #155724;
+                }
+                .delete {
+                    background-color: #f8d7da !important;
+                    color: #721c24;
+                }
+                .recommendations {
+                    background: #e9ecef;
+                    padding: 20px;
+                    border-radius: 5px;
+                    margin-top: 30px;
+                }
+                .footer {
+                    text-align: center;
+                    margin-top: 40px;
+                    padding-top: 20px;
+                    border-top: 1px solid #dee2e6;
+                    color: #6c757d;
+                    font-size: 0.9em;
+                }
+            </style>
+        </head>"""
+
+
 class ImageDeduplicatorGUI:
     """GUI interface for the image deduplicator."""
     
@@ -444,6 +1245,21 @@ class ImageDeduplicatorGUI:
                 self.style.map('cancel_running.TButton', background=[('active', '#ff5252'), ('disabled', self.palette['disabled'])])
             except Exception:
                 pass
+            # Visual review: group header and image cards on the medium/dark
+            # gray image background. Set once here; configuring styles per
+            # group or per card forces a restyle every time
+            try:
+                self.style.configure('GroupHeader.TLabelframe', background=self.palette['light_panel'])
+                self.style.configure('GroupHeader.TLabelframe.Label',
+                       background=self.palette['light_panel'],
+                       foreground='#e0e0e0',  # Light gray text
+                       font=('TkDefaultFont', 10, 'bold'))
+                self.style.configure('ImageCard.TLabel', background=self.palette['light_panel'], foreground=self.palette['text'])
+                self.style.configure('ImageCard.TCheckbutton', background=self.palette['light_panel'], foreground=self.palette['text'])
+                self.style.configure('Card.TLabelframe', background=self.palette['light_panel'])
+                self.style.configure('Card.TLabelframe.Label', background=self.palette['light_panel'], foreground=self.palette['text'])
+            except Exception:
+                pass
         except Exception:
             # If style configuration fails, continue with default styles
             pass
@@ -463,13 +1279,26 @@ class ImageDeduplicatorGUI:
         # Fixed thumbnail size (width, height)
         # Increased slightly so images are more visible in visual review
         self.thumb_size = (200, 200)
+        # Least-recently-used PhotoImage thumbnails, keyed by file path
+        self._thumb_cache = OrderedDict()
+        # Least-recently-used comparison previews, keyed by file and size
+        self._preview_cache = OrderedDict()
+        # Decodes visual-review thumbnails off the Tk thread
+        self.thumb_executor = ThreadPoolExecutor(max_workers=THUMB_WORKERS)
+        self.thumb_executor.submit(self._prune_thumb_cache)
         self.deduplicator = None
         self.selected_groups = set()
         
-        # Threading
-        self.scan_thread = None
+        # Threading: scans run one at a time on their own executor and are
+        # cancelled through an event the worker checks between files
+        self.scan_executor = ThreadPoolExecutor(max_workers=1)
+        self.scan_future = None
+        self._cancel_event = threading.Event()
+        # Exports are written off the Tk thread too, independent of scans
+        self.export_executor = ThreadPoolExecutor(max_workers=1)
         self.message_queue = queue.Queue()
-        self.is_scanning = False
+        # Set once the main loop has ended, so late worker messages are dropped
+        self._closed = False
         
         self.setup_ui()
         self.setup_threading()
@@ -682,33 +1511,72 @@ class ImageDeduplicatorGUI:
         status_bar.grid(row=4, column=0, sticky=(tk.W, tk.E), pady=5)
         status_bar.configure(background=self.palette['panel'], foreground=self.palette['muted'])
     
+    @property
+    def is_scanning(self):
+        """Whether a scan or deletion is running (or still winding down after a cancel)."""
+        return self.scan_future is not None and not self.scan_future.done()
+    
     def setup_threading(self):
         """Setup threading for responsive GUI."""
-        # Check for messages from worker thread
-        self.root.after(100, self.check_queue)
+        # Worker threads signal new messages with a virtual event, so the
+        # queue is drained as soon as something arrives rather than polled
+        self.root.bind('<<QueueMessage>>', lambda event: self._drain_queue())
+        self.root.after(QUEUE_SAFETY_POLL_MS, self._poll_queue)
+    
+    def _poll_queue(self):
+        """Low-frequency safety net in case a queue signal was lost."""
+        self._drain_queue()
+        self.root.after(QUEUE_SAFETY_POLL_MS, self._poll_queue)
     
-    def check_queue(self):
-        """Check for messages from the worker thread."""
+    def _post_message(self, message):
+        """Queue a message from a worker thread and wake the Tk event loop."""
+        if self._closed:
+            return  # The Tk root is gone; nothing is left to handle it
+        self.message_queue.put(message)
+        try:
+            # event_generate with when='tail' is safe to call off the Tk thread
+            self.root.event_generate('<<QueueMessage>>', when='tail')
+        except (tk.TclError, RuntimeError):
+            pass  # Window is closing; the safety poll or exit handles it
+    
+    def _drain_queue(self):
+        """Handle every message waiting from the worker thread."""
+        pending_progress = None
         try:
             while True:
                 message = self.message_queue.get_nowait()
+                if message.get('type') in ('progress', 'delete_progress'):
+                    # Only the newest progress value is worth drawing
+                    pending_progress = message
+                    continue
+                if pending_progress is not None:
+                    self.handle_thread_message(pending_progress)
+                    pending_progress = None
                 self.handle_thread_message(message)
         except queue.Empty:
-            pass
-        finally:
-            # Schedule next check
-            self.root.after(100, self.check_queue)
+            if pending_progress is not None:
+                self.handle_thread_message(pending_progress)
     
     def handle_thread_message(self, message):
         """Handle messages from the worker thread."""
         msg_type = message.get('type')
-        
-        if msg_type == 'progress':
+        if msg_type not in ('walking', 'thumbnail', 'export_complete'):
+            self._stop_walk_indicator()
+        
+        if msg_type == 'walking':
+            # The total isn't known until the walk ends, so animate the bar
+            # instead of filling it
+            if str(self.progress.cget('mode')) != 'indeterminate':
+                self.progress.config(mode='indeterminate')
+                self.progress.start(WALK_ANIMATION_MS)
+            self.status_var.set(f"Finding images... {message['found']} found")
+        
+        elif msg_type == 'progress':
             self.status_var.set(f"Processing... {message['current']}/{message['total']} files")
-            self.progress['value'] = (message['current'] / message['total']) * 100
+            # Whole percent steps; finer values don't change the bar
+            self.progress['value'] = message['current'] * 100 // message['total']
         
         elif msg_type == 'complete':
-            self.is_scanning = False
             self.progress['value'] = 100
             self.status_var.set("Scan complete")
             self.scan_button.config(state='normal', text="Scan for Duplicates")
@@ -721,18 +1589,49 @@ class ImageDeduplicatorGUI:
             self.display_results()
         
         elif msg_type == 'error':
-            self.is_scanning = False
             self.progress['value'] = 0
-            self.status_var.set("Scan failed")
+            self.status_var.set(message.get('status', "Scan failed"))
             self.scan_button.config(state='normal', text="Scan for Duplicates")
             try:
                 self.cancel_button.config(state='disabled', style=getattr(self, 'cancel_default_style', 'TButton'))
             except Exception:
                 self.cancel_button.config(state='disabled')
+            # A failed deletion leaves the remaining duplicates to retry
+            if self.deduplicator and self.deduplicator.duplicates:
+                self.delete_button.config(state='normal')
             messagebox.showerror("Error", message['error'])
         
+        elif msg_type == 'thumbnail':
+            message['callback'](message['future'])
+        
+        elif msg_type == 'export_complete':
+            error = message['future'].exception()
+            if error is not None:
+                messagebox.showerror("Error", f"Failed to export {message['format']}:\n{error}")
+            else:
+                messagebox.showinfo("Success", f"Exported successfully to {message['format']} format!")
+        
+        elif msg_type == 'delete_progress':
+            self.status_var.set(f"Deleting... {message['current']}/{message['total']} files")
+            self.progress['value'] = message['current'] * 100 // message['total']
+        
+        elif msg_type == 'delete_complete':
+            result = message['result']
+            self.status_var.set("Deletion cancelled" if result['cancelled'] else "Deletion complete")
+            self.scan_button.config(state='normal', text="Scan for Duplicates")
+            self.delete_button.config(state='normal')
+            try:
+                self.cancel_button.config(state='disabled', style=getattr(self, 'cancel_default_style', 'TButton'))
+            except Exception:
+                self.cancel_button.config(state='disabled')
+            messagebox.showinfo("Deletion Complete", 
+                              f"Deleted {result['deleted']} files.\n"
+                              f"Errors: {result['errors']}")
+            
+            # Refresh results
+            self.display_results()
+        
         elif msg_type == 'cancelled':
-            self.is_scanning = False
             self.progress['value'] = 0
             self.status_var.set("Scan cancelled")
             self.scan_button.config(state='normal', text="Scan for Duplicates")
@@ -741,13 +1640,19 @@ class ImageDeduplicatorGUI:
             except Exception:
                 self.cancel_button.config(state='disabled')
     
+    def _stop_walk_indicator(self):
+        """Switch the progress bar back from the directory-walk animation."""
+        if str(self.progress.cget('mode')) == 'indeterminate':
+            self.progress.stop()
+            self.progress.config(mode='determinate')
+    
     def cancel_scan(self):
         """Cancel the current scan."""
         if self.is_scanning:
-            # Signal the worker to stop by clearing the flag. The worker will
-            # detect this and finish; do NOT enqueue a 'cancelled' message
-            # here because that would cause the UI to revert immediately.
-            self.is_scanning = False
+            # Signal the worker to stop. It finishes at the next file and
+            # _on_scan_done reports 'cancelled'; the UI is not reverted here
+            # because the worker is still winding down.
+            self._cancel_event.set()
             # Update the UI: show Cancelling and disable the cancel button
             # but keep the running (red) style so it stays visually active
             try:
@@ -777,7 +1682,6 @@ class ImageDeduplicatorGUI:
             return
         
         # Update UI for scanning
-        self.is_scanning = True
         self.scan_button.config(state='disabled', text="Scanning...")
         # Enable and style the cancel button for running state
         try:
@@ -789,31 +1693,34 @@ class ImageDeduplicatorGUI:
         self.status_var.set("Starting scan...")
         self.results_text.delete(1.0, tk.END)
         
-        # Start scan in separate thread
-        self.scan_thread = threading.Thread(
-            target=self._scan_worker,
-            args=(directory,),
-            daemon=True
-        )
-        self.scan_thread.start()
+        # Start scan on the scan executor
+        self._cancel_event.clear()
+        self.scan_future = self.scan_executor.submit(
+            self._scan_worker, directory,
+            self.threshold_var.get(), self.dry_run_var.get())
+        self.scan_future.add_done_callback(self._on_scan_done)
     
-    def _scan_worker(self, directory):
+    def _scan_worker(self, directory, threshold, dry_run):
         """Worker thread for scanning duplicates."""
+        # Create deduplicator
+        self.deduplicator = ImageDeduplicator(threshold=threshold, dry_run=dry_run)
+        
+        # Custom find_duplicates with progress updates
         try:
-            # Create deduplicator
-            self.deduplicator = ImageDeduplicator(
-                threshold=self.threshold_var.get(),
-                dry_run=self.dry_run_var.get()
-            )
-            
-            # Custom find_duplicates with progress updates
-            duplicates = self._find_duplicates_with_progress(directory)
-            
-            # Send completion message
-            self.message_queue.put({'type': 'complete', 'duplicates': duplicates})
-            
-        except Exception as e:
-            self.message_queue.put({'type': 'error', 'error': str(e)})
+            return self._find_duplicates_with_progress(directory)
+        finally:
+            self.deduplicator.close()
+    
+    def _on_scan_done(self, future):
+        """Report a finished scan to the Tk thread (runs on the worker thread)."""
+        if self._cancel_event.is_set():
+            self._post_message({'type': 'cancelled'})
+            return
+        error = future.exception()
+        if error is not None:
+            self._post_message({'type': 'error', 'error': str(error)})
+        else:
+            self._post_message({'type': 'complete', 'duplicates': future.result()})
     
     def _find_duplicates_with_progress(self, directory):
         """Find duplicates with progress updates."""
@@ -821,68 +1728,44 @@ class ImageDeduplicatorGUI:
         if not directory_path.exists() or not directory_path.is_dir():
             raise ValueError(f"Directory does not exist: {directory}")
         
-        # Collect all image files
-        image_files = []
-        for file_path in directory_path.rglob('*'):
-            if file_path.is_file() and self.deduplicator.is_image_file(file_path):
-                image_files.append(file_path)
+        # Collect all image files, reporting how many have turned up so far:
+        # exact-duplicate candidates depend on every file's size, so hashing
+        # can only start once the walk is complete
+        next_report = 0
+        
+        def report_found(found):
+            nonlocal next_report
+            if found >= next_report:
+                next_report = found + WALK_PROGRESS_STEP
+                self._post_message({'type': 'walking', 'found': found})
+        
+        image_files = self.deduplicator.collect_image_files(directory_path, progress=report_found)
         
         self.deduplicator.stats['total_files'] = len(image_files)
         
-        if not image_files:
+        if not image_files or self._cancel_event.is_set():
             return []
         
-        # Group by exact hash (identical files)
-        exact_duplicates = defaultdict(list)
-        perceptual_groups = defaultdict(list)
+        progress_step = max(1, len(image_files) // PROGRESS_STEPS)
         
-        for i, file_path in enumerate(image_files):
-            if not self.is_scanning:  # Check for cancellation
-                return []
-            
-            # Update progress
-            self.message_queue.put({
-                'type': 'progress',
-                'current': i,
-                'total': len(image_files)
-            })
+        def report_processed(processed, total):
+            if self._cancel_event.is_set():  # Check for cancellation
+                return True
             
-            # Get file hash for exact duplicates
-            file_hash = self.deduplicator.get_file_hash(file_path)
-            if file_hash:
-                exact_duplicates[file_hash].append(file_path)
-            
-            # Get perceptual hash for similar images
-            perceptual_hash = self.deduplicator.get_perceptual_hash(file_path)
-            if perceptual_hash:
-                perceptual_groups[perceptual_hash].append(file_path)
-            
-            self.deduplicator.stats['processed_files'] += 1
-        
-        # Process exact duplicates
-        duplicate_groups = []
-        for file_hash, files in exact_duplicates.items():
-            if len(files) > 1:
-                group = self.deduplicator._create_duplicate_group(files, 'exact')
-                if group:
-                    duplicate_groups.append(group)
-        
-        # Process perceptual duplicates
-        for perceptual_hash, files in perceptual_groups.items():
-            if len(files) > 1:
-                # Check similarity within the group
-                similar_groups = self.deduplicator._group_similar_images(files)
-                for group_files in similar_groups:
-                    if len(group_files) > 1:
-                        group = self.deduplicator._create_duplicate_group(group_files, 'similar')
-                        if group:
-                            duplicate_groups.append(group)
-        
-        self.deduplicator.duplicates = duplicate_groups
-        self.deduplicator.stats['duplicate_groups'] = len(duplicate_groups)
-        self.deduplicator.stats['files_to_delete'] = sum(len(group['files']) - 1 for group in duplicate_groups)
-        
-        return duplicate_groups
+            # Update progress, at most PROGRESS_STEPS times per scan
+            if processed % progress_step == 0 or processed == total - 1:
+                self._post_message({
+                    'type': 'progress',
+                    'current': processed,
+                    'total': total
+                })
+            return False
+        
+        # Hashing runs on the deduplicator's worker pool (processes for large
+        # scans), so this thread only collects results and never competes
+        # with Tk for the GIL while decoding images
+        return self.deduplicator.group_image_files(directory_path, image_files,
+                                                  progress=report_processed) or []
     
     def display_results(self):
         """Display scan results in the text area."""
@@ -890,28 +1773,35 @@ class ImageDeduplicatorGUI:
             return
         
         stats = self.deduplicator.stats
-        results = f"Scan Results:\n"
-        results += f"{'='*50}\n"
-        results += f"Total files scanned: {stats['total_files']}\n"
-        results += f"Files processed: {stats['processed_files']}\n"
-        results += f"Duplicate groups found: {stats['duplicate_groups']}\n"
-        results += f"Files that can be deleted: {stats['files_to_delete']}\n"
-        results += f"Space that can be saved: {self.deduplicator._format_size(stats['space_saved'])}\n\n"
+        format_size = self.deduplicator._format_size
+        # Collect the report as lines and hand it to the text widget in one
+        # insert; repeated += on a growing string is quadratic
+        lines = [
+            "Scan Results:",
+            "="*50,
+            f"Total files scanned: {stats['total_files']}",
+            f"Files processed: {stats['processed_files']}",
+            f"Duplicate groups found: {stats['duplicate_groups']}",
+            f"Files that can be deleted: {stats['files_to_delete']}",
+            f"Space that can be saved: {format_size(stats['space_saved'])}",
+            "",
+        ]
         
         if not self.deduplicator.duplicates:
-            results += "No duplicates found!\n"
+            lines.append("No duplicates found!")
         else:
-            results += "Duplicate Groups:\n"
-            results += f"{'='*50}\n"
+            lines.append("Duplicate Groups:")
+            lines.append("="*50)
             
             for i, group in enumerate(self.deduplicator.duplicates):
-                results += f"\nGroup {i+1} ({group['type']} duplicates):\n"
-                results += f"  Keep: {group['keep']['path']} ({self.deduplicator._format_size(group['keep']['size'])})\n"
+                lines.append(f"\nGroup {i+1} ({group['type']} duplicates):")
+                lines.append(f"  Keep: {group['keep']['path']} ({format_size(group['keep']['size'])})")
                 for file_info in group['delete']:
-                    results += f"  Delete: {file_info['path']} ({self.deduplicator._format_size(file_info['size'])})\n"
-                results += f"  Space saved: {self.deduplicator._format_size(group['space_saved'])}\n"
+                    lines.append(f"  Delete: {file_info['path']} ({format_size(file_info['size'])})")
+                lines.append(f"  Space saved: {format_size(group['space_saved'])}")
+        lines.append("")
         
-        self.results_text.insert(tk.END, results)
+        self.results_text.insert(tk.END, "\n".join(lines))
         
         # Refresh visual interface
         self.refresh_visual()
@@ -973,20 +1863,12 @@ class ImageDeduplicatorGUI:
         self.visual_review_frame.columnconfigure(0, weight=1)
         self.visual_review_frame.rowconfigure(0, weight=1)
 
+        # The frame is the canvas's only item, anchored at the origin, so its
+        # new size is the scroll region; no need to ask the canvas for a bbox
         scrollable_frame.bind(
             "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            lambda e: canvas.configure(scrollregion=(0, 0, e.width, e.height))
         )
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        # Configure the group header style first
-        self.style.configure('GroupHeader.TLabelframe',
-               background=self.palette['light_panel'])  # Medium/dark gray
-        self.style.configure('GroupHeader.TLabelframe.Label',
-               background=self.palette['light_panel'],  # Medium/dark gray
-               foreground='#e0e0e0',  # Light gray text
-               font=('TkDefaultFont', 10, 'bold'))
 
         # Group info with light grey background and dark text
         info_frame = ttk.LabelFrame(scrollable_frame, 
@@ -997,13 +1879,6 @@ class ImageDeduplicatorGUI:
         # Configure weight for the info frame column
         scrollable_frame.columnconfigure(0, weight=1)
         
-        # Style the frame and its label for light background
-        self.style.configure('GroupHeader.TLabelframe', background=self.palette['light_panel'])
-        self.style.configure('GroupHeader.TLabelframe.Label',
-               background=self.palette['light_panel'],
-               foreground='#e0e0e0',
-               font=('TkDefaultFont', 10, 'bold'))
-
         # Info text with explicit styling
         info_label = ttk.Label(info_frame, 
                             text=f"Files: {len(group['files'])} | Space saved: {self.deduplicator._format_size(group['space_saved'])}",
@@ -1011,63 +1886,312 @@ class ImageDeduplicatorGUI:
         info_label.grid(row=0, column=0, pady=4, sticky="ew")
         info_frame.columnconfigure(0, weight=1)
 
-        # Image display frame with medium/dark gray background
+        # Image display frame with medium/dark gray background. Cards are
+        # placed over it by row, so its height is set explicitly below
         images_frame = tk.Frame(scrollable_frame, bg=self.palette['light_panel'])
         images_frame.grid(row=1, column=0, sticky="nsew", padx=6, pady=4)
         scrollable_frame.rowconfigure(1, weight=1)
         scrollable_frame.columnconfigure(0, weight=1)
 
-        # Grid for responsive image layout
+        files = group['files']
         num_columns = 3  # Number of images per row
-        current_row = 0
-        current_col = 0
+        num_rows = -(-len(files) // num_columns)
+        card_pad = 5
+
+        # Selection state lives outside the cards, so it survives a card
+        # being rebound to another file while scrolling
+        self.image_vars = {
+            f"group_{group_index}_img_{i}": tk.BooleanVar(value=(i == 0))
+            for i in range(len(files))
+        }
 
-        # Create image selection variables
-        self.image_vars = {}
-        self.image_thumbnails = {}
-        self.image_labels = {}
+        # Card captions never change while the group is shown, so build them
+        # once here rather than every time a card is rebound
+        format_size = self.deduplicator._format_size
+        info_texts = [f"File: {os.path.basename(file_info['path'])}\nSize: {format_size(file_info['size'])}"
+                      for file_info in files]
+
+        # Only the rows in view get widgets: a pool of image cards is placed
+        # over the visible rows and rebound to other files as the list
+        # scrolls. Every row has the height of a card showing the longest
+        # caption, measured once up front
+        probe = self._create_image_card(images_frame)
+        longest = max(range(len(files)), key=lambda i: len(info_texts[i]))
+        self._bind_image_card(probe, files[longest], longest, group_index,
+                              info_texts[longest], load_thumbnail=False)
+        probe['frame'].update_idletasks()
+        row_height = probe['frame'].winfo_reqheight() + 2 * card_pad
+        images_frame.configure(height=num_rows * row_height)
+
+        free_cards = [probe]
+        bound_cards = {}  # file index -> card showing it
+
+        def refresh_visible_cards():
+            if not images_frame.winfo_exists():
+                return
+            # Visible span in images_frame coordinates, plus a row either side
+            top = canvas.canvasy(0) - images_frame.winfo_y()
+            bottom = top + canvas.winfo_height()
+            first_row = max(0, int(top // row_height) - 1)
+            last_row = min(num_rows - 1, int(bottom // row_height) + 1)
+            wanted = range(first_row * num_columns,
+                           min(len(files), (last_row + 1) * num_columns))
+
+            for index in [index for index in bound_cards if index not in wanted]:
+                card = bound_cards.pop(index)
+                card['frame'].place_forget()
+                free_cards.append(card)
+
+            for index in wanted:
+                if index in bound_cards:
+                    continue
+                card = free_cards.pop() if free_cards else self._create_image_card(images_frame)
+                self._bind_image_card(card, files[index], index, group_index, info_texts[index])
+                row, col = divmod(index, num_columns)
+                card['frame'].place(relx=col / num_columns, x=card_pad,
+                                    y=row * row_height + card_pad,
+                                    relwidth=1 / num_columns, width=-2 * card_pad)
+                bound_cards[index] = card
+
+        def on_canvas_configure(event):
+            # Stretch the content to the canvas width so cards share it
+            canvas.itemconfigure(window, width=event.width)
+            refresh_visible_cards()
+
+        def on_yscroll(first, last):
+            # Every view change (scrollbar, wheel, resize) ends up here
+            scrollbar.set(first, last)
+            refresh_visible_cards()
+
+        window = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=on_yscroll)
+        canvas.bind("<Configure>", on_canvas_configure)
+    
+    def _get_cached_thumbnail(self, cache_key):
+        """Return the cached thumbnail for a file (marking it recently used), or None."""
+        photo = self._thumb_cache.get(cache_key)
+        if photo is not None:
+            self._thumb_cache.move_to_end(cache_key)
+        return photo
+
+    def _cache_thumbnail(self, cache_key, photo):
+        """Cache a thumbnail, dropping the least recently used ones over the cap."""
+        self._thumb_cache[cache_key] = photo
+        self._thumb_cache.move_to_end(cache_key)
+        # Widgets still showing an evicted image keep their own reference;
+        # otherwise dropping ours frees the Tk image
+        while len(self._thumb_cache) > THUMB_CACHE_SIZE:
+            self._thumb_cache.popitem(last=False)
+
+    def _load_thumbnail(self, file_info):
+        """Return an RGB thumbnail of an image, reusing the on-disk thumbnail cache."""
+        file_path = file_info['path']
+        key = f"{file_path}|{file_info['modified']}|{file_info['size']}|{self.thumb_size}"
+        cache_file = THUMB_CACHE_DIR / f"{hashlib.blake2b(key.encode(), digest_size=8).hexdigest()}.png"
+        cached = self._read_cache_image(cache_file)
+        if cached is not None:
+            return cached
+        
+        with Image.open(file_path) as img:
+            # Let JPEGs decode at a reduced scale close to the
+            # thumbnail size instead of at full resolution
+            img.draft('RGB', self.thumb_size)
+            # Load before the file closes: thumbnail() leaves images that
+            # already fit the box untouched (and unloaded)
+            img.load()
+            if img.mode != 'RGB':
+                img = img.convert('RGB')
+            img.thumbnail(self.thumb_size, Image.Resampling.LANCZOS)
+        
+        self._write_cache_image(img, cache_file)
+        return img
+
+    @staticmethod
+    def _read_cache_image(cache_file):
+        """Return an image from the on-disk thumbnail cache, or None if it isn't there."""
+        try:
+            with Image.open(cache_file) as cached:
+                cached.load()
+        except (IOError, OSError):
+            return None  # Not cached yet (or unreadable)
+        # Mark the entry as used, so pruning removes the ones that stopped
+        # being hit (edited or deleted files) first
+        try:
+            os.utime(cache_file)
+        except OSError:
+            pass
+        return cached
+
+    @staticmethod
+    def _prune_thumb_cache():
+        """Remove stale on-disk thumbnail cache entries and cap its total size (runs on the thumbnail workers)."""
+        # Keys include each file's mtime and size, so entries for edited or
+        # deleted files are never read again; their mtime stops moving and
+        # they age out
+        entries = []
+        try:
+            with os.scandir(THUMB_CACHE_DIR) as it:
+                for entry in it:
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            return  # Nothing cached yet
+        
+        entries.sort(reverse=True)  # Most recently used first
+        cutoff = time.time() - THUMB_CACHE_MAX_AGE
+        total = 0
+        for mtime, size, path in entries:
+            total += size
+            if mtime < cutoff or total > THUMB_CACHE_MAX_BYTES:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _write_cache_image(img, cache_file, pnginfo=None):
+        """Store an image in the on-disk thumbnail cache, best effort."""
+        # Written under a temporary name and renamed into place, so a worker
+        # reading the same entry never sees a half-written file
+        temp_file = cache_file.with_name(f"{cache_file.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            THUMB_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Fast, light compression: these are small and read back often
+            img.save(temp_file, 'PNG', compress_level=1, pnginfo=pnginfo)
+            os.replace(temp_file, cache_file)
+        except (IOError, OSError):
+            try:
+                temp_file.unlink()
+            except OSError:
+                pass
 
-        # Display each image in the group
-        for i, file_info in enumerate(group['files']):
-            current_row = i // num_columns
-            current_col = i % num_columns
-            images_frame.columnconfigure(current_col, weight=1)
-            # Create and grid the image widget
-            self.create_image_widget(images_frame, file_info, i, group_index, row=current_row, col=current_col)
-
-        # Configure row weights for vertical scaling
-        for row in range(current_row + 1):
-            images_frame.rowconfigure(row, weight=1)
-    
-    def create_image_widget(self, parent, file_info, index, group_index, row=0, col=0):
-        """Create a widget for displaying and selecting an image."""
+    def _load_preview(self, file_info, box_size, on_loaded, on_error):
+        """
+        Hand a comparison preview of an image to on_loaded(preview, exif_text) on the Tk thread.
+        
+        Cached previews are delivered immediately; otherwise the file is
+        decoded on the thumbnail workers and the callbacks run once the
+        result is back (on_error(exception) if decoding failed).
+        """
+        # Keyed on size and mtime too, so an edited file is decoded afresh
+        cache_key = (file_info['path'], file_info['modified'], file_info['size'], box_size)
+        preview = self._preview_cache.get(cache_key)
+        if preview is not None:
+            self._preview_cache.move_to_end(cache_key)
+            on_loaded(*preview)
+            return
+        
+        def deliver(future):
+            try:
+                preview = future.result()
+            except Exception as e:
+                on_error(e)
+                return
+            self._preview_cache[cache_key] = preview
+            while len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+                self._preview_cache.popitem(last=False)
+            on_loaded(*preview)
+        
+        # Pillow releases the GIL while decoding and resampling, so previews
+        # decode in parallel; the PhotoImage is made back on the Tk thread
+        future = self.thumb_executor.submit(self._decode_preview, file_info, box_size)
+        future.add_done_callback(lambda done: self._post_message(
+            {'type': 'thumbnail', 'future': done, 'callback': deliver}))
+
+    def _decode_preview(self, file_info, box_size):
+        """
+        Decode an RGB copy of an image shrunk to fit box_size (runs on the thumbnail workers).
+        
+        Returns:
+            (preview, exif_text); the EXIF summary is read from the same open
+            file (see _format_exif)
+        """
+        # Previews at the default zoom also go through the on-disk thumbnail
+        # cache, with the EXIF summary kept in a PNG text chunk
+        cache_file = None
+        if box_size == (PREVIEW_SIZE, PREVIEW_SIZE):
+            key = f"{file_info['path']}|{file_info['modified']}|{file_info['size']}|preview{box_size}"
+            cache_file = THUMB_CACHE_DIR / f"{hashlib.blake2b(key.encode(), digest_size=8).hexdigest()}.png"
+            cached = self._read_cache_image(cache_file)
+            if cached is not None:
+                return cached, cached.text.get('exif') or None
+        
+        with Image.open(file_info['path']) as img:
+            exif_text = self._format_exif(img)
+            # Let JPEGs decode at a reduced DCT scale (1/2 to 1/8) close to
+            # the box instead of at full resolution
+            img.draft('RGB', box_size)
+            # Load before the file closes: thumbnail() leaves images that
+            # already fit the box untouched (and unloaded)
+            img.load()
+            if img.mode != 'RGB':
+                img = img.convert('RGB')
+            # Below the default zoom the cheaper bilinear filter is
+            # indistinguishable at these sizes
+            if box_size[0] < PREVIEW_SIZE:
+                resample = Image.Resampling.BILINEAR
+            else:
+                resample = Image.Resampling.LANCZOS
+            img.thumbnail(box_size, resample)
+        
+        if cache_file is not None:
+            pnginfo = PngImagePlugin.PngInfo()
+            pnginfo.add_text('exif', exif_text or '')
+            self._write_cache_image(img, cache_file, pnginfo)
+        return img, exif_text
+
+    @staticmethod
+    def _format_exif(img):
+        """Summarise camera EXIF data of an open image, or return None if it has none."""
+        try:
+            exif = img.getexif()
+            directories = {None: exif, EXIF_IFD: exif.get_ifd(EXIF_IFD)}
+            exif_info = [f"{label}: {directories[ifd][tag]}"
+                         for ifd, tag, label in EXIF_FIELDS if tag in directories[ifd]]
+        except Exception:
+            return None
+        return "\n".join(exif_info[:4]) or None  # Limit to 4 lines
+
+    def _forget_previews(self, file_path):
+        """Drop the cached comparison previews of a file."""
+        for cache_key in [key for key in self._preview_cache if key[0] == file_path]:
+            del self._preview_cache[cache_key]
+
+    def _render_thumbnail(self, file_info):
+        """Return a file's thumbnail centred on a thumb_size background, ready for a PhotoImage."""
+        img = self._load_thumbnail(file_info)
+        # Always use the fixed thumbnail size for consistency
+        target_size = self.thumb_size
+
+        # Paste thumbnail onto a background to ensure consistent cell size.
+        # This runs on the thumbnail workers, leaving the Tk thread only the
+        # PhotoImage conversion
+        thumb = Image.new('RGB', target_size, self.palette.get('light_panel', '#0f2230'))
+        x = (target_size[0] - img.width) // 2
+        y = (target_size[1] - img.height) // 2
+        thumb.paste(img, (x, y))
+        return thumb
+
+    def _create_image_card(self, parent):
+        """Create an empty image card; _bind_image_card fills it in for a file."""
         # Create frame for this image with light background
-        img_frame = ttk.LabelFrame(parent, text=f"Image {index + 1}", style='Card.TLabelframe')
-        img_frame.grid(row=row, column=col, padx=5, pady=5, sticky='nsew')
-        parent.rowconfigure(row, weight=1)
-        parent.columnconfigure(col, weight=1)
-
-        # Image selection variable
-        var_name = f"group_{group_index}_img_{index}"
-        self.image_vars[var_name] = tk.BooleanVar()
+        img_frame = ttk.LabelFrame(parent, style='Card.TLabelframe')
 
-        # Checkbox for selection
         # Create inner frame for content
         content_frame = ttk.Frame(img_frame)
         content_frame.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
         img_frame.columnconfigure(0, weight=1)
         img_frame.rowconfigure(0, weight=1)
         
+        # Checkbox for selection
         checkbox = ttk.Checkbutton(content_frame, text="Keep this image",
-                                 style='ImageCard.TCheckbutton',
-                                 variable=self.image_vars[var_name])
+                                 style='ImageCard.TCheckbutton')
         checkbox.grid(row=0, column=0, pady=(5,2), sticky="w")
         content_frame.columnconfigure(0, weight=1)
 
-        # Set default selection (keep largest file)
-        if index == 0:
-            self.image_vars[var_name].set(True)
-
         # Image frame for thumbnail (fixed size to avoid pushing buttons out)
         image_frame = ttk.Frame(content_frame)
         # Use fixed width/height based on self.thumb_size and prevent propagation
@@ -1078,51 +2202,10 @@ class ImageDeduplicatorGUI:
         # Keep the image area from expanding and pushing buttons out
         content_frame.rowconfigure(1, weight=0)
 
-        def update_thumbnail(event=None):
-            try:
-                with Image.open(file_info['path']) as img:
-                    if img.mode != 'RGB':
-                        img = img.convert('RGB')
-                    # Always use the fixed thumbnail size for consistency
-                    target_size = self.thumb_size
-                    img.thumbnail(target_size, Image.Resampling.LANCZOS)
-
-                    # Paste thumbnail onto a background to ensure consistent cell size
-                    thumb = Image.new('RGB', target_size, self.palette.get('light_panel', '#0f2230'))
-                    x = (target_size[0] - img.width) // 2
-                    y = (target_size[1] - img.height) // 2
-                    thumb.paste(img, (x, y))
-
-                    photo = ImageTk.PhotoImage(thumb)
-                    self.image_thumbnails[var_name] = photo
-                    if var_name in self.image_labels:
-                        self.image_labels[var_name].configure(image=photo, text="")
-                        self.image_labels[var_name].image = photo
-                    else:
-                        img_label = ttk.Label(image_frame, image=photo, style='ImageCard.TLabel')
-                        img_label.grid(row=0, column=0, pady=5, sticky="n")
-                        img_label.image = photo
-                        image_frame.columnconfigure(0, weight=1)
-                        image_frame.rowconfigure(0, weight=1)
-                        self.image_labels[var_name] = img_label
-            except Exception as e:
-                if var_name in self.image_labels:
-                    self.image_labels[var_name].configure(text=f"Error loading image:\n{str(e)[:50]}...", image="")
-                else:
-                    img_label = ttk.Label(image_frame, text=f"Error loading image:\n{str(e)[:50]}...", style='ImageCard.TLabel')
-                    img_label.grid(row=0, column=0, pady=5, sticky="nsew")
-                    image_frame.columnconfigure(0, weight=1)
-                    image_frame.rowconfigure(0, weight=1)
-                    self.image_labels[var_name] = img_label
-
-        # Bind to the frame configure only to refresh thumbnails if needed,
-        # but sizing is fixed so thumbnails will remain consistent.
-        img_frame.bind('<Configure>', update_thumbnail)
-        update_thumbnail()
-        
-        # File info (simplified for better layout)
-        info_text = f"File: {Path(file_info['path']).name}\n"
-        info_text += f"Size: {self.deduplicator._format_size(file_info['size'])}"
+        img_label = ttk.Label(image_frame, style='ImageCard.TLabel')
+        img_label.grid(row=0, column=0, pady=5, sticky="n")
+        image_frame.columnconfigure(0, weight=1)
+        image_frame.rowconfigure(0, weight=1)
         
         # Wrap long filenames so they don't expand the cell width
         try:
@@ -1130,8 +2213,8 @@ class ImageDeduplicatorGUI:
         except Exception:
             info_font = None
         wrap_px = self.thumb_size[0]
-        info_label = ttk.Label(content_frame, text=info_text,
-                              justify=tk.LEFT, style='ImageCard.TLabel', wraplength=wrap_px, font=info_font)
+        info_label = ttk.Label(content_frame, justify=tk.LEFT, style='ImageCard.TLabel',
+                              wraplength=wrap_px, font=info_font)
         info_label.grid(row=2, column=0, pady=(2,5), sticky="w")
         
         # Add action buttons in a grid layout
@@ -1141,25 +2224,79 @@ class ImageDeduplicatorGUI:
         button_frame.columnconfigure(1, weight=1)
         
         # Comparison button
-        compare_btn = ttk.Button(button_frame, text="Compare", 
-                               command=lambda: self.show_comparison(group_index, index),
-                               style='primary.TButton')
+        compare_btn = ttk.Button(button_frame, text="Compare", style='primary.TButton')
         compare_btn.grid(row=0, column=0, padx=5, sticky="ew")
         
         # Individual delete button
-        delete_btn = ttk.Button(button_frame, text="Delete This Image", 
-                              command=lambda: self.delete_single_image(file_info['path'], group_index, index),
-                              style="danger.TButton")
+        delete_btn = ttk.Button(button_frame, text="Delete This Image", style="danger.TButton")
         delete_btn.grid(row=0, column=1, padx=5, sticky="ew")
-        
-        # Style for better visibility on light background
+
+        return {
+            'frame': img_frame,
+            'checkbox': checkbox,
+            'image': img_label,
+            'info': info_label,
+            'compare': compare_btn,
+            'delete': delete_btn,
+            'file_info': None,
+        }
+
+    def _bind_image_card(self, card, file_info, index, group_index, info_text, load_thumbnail=True):
+        """Show a file in an image card, replacing whatever it showed before."""
+        card['file_info'] = file_info
+        var_name = f"group_{group_index}_img_{index}"
+        card['frame'].configure(text=f"Image {index + 1}")
+        card['checkbox'].configure(variable=self.image_vars[var_name])
+        card['compare'].configure(command=lambda: self.show_comparison(group_index, index))
+        card['delete'].configure(
+            command=lambda: self.delete_single_image(file_info['path'], group_index, index))
+        card['info'].configure(text=info_text)
+
+        img_label = card['image']
+        img_label.configure(image="", text="")
+        img_label.image = None
+        if not load_thumbnail:
+            return
+
+        # Keyed on size and mtime too, so an edited file isn't
+        # shown with its old thumbnail
+        cache_key = (file_info['path'], file_info['modified'], file_info['size'])
+
+        def show_photo(photo):
+            img_label.configure(image=photo, text="")
+            img_label.image = photo
+
+        def show_error(e):
+            img_label.configure(text=f"Error loading image:\n{str(e)[:50]}...", image="")
+
+        def show_thumbnail(future):
+            # Runs on the Tk thread once the background decode finishes;
+            # the group may have been switched away from in the meantime
+            if not img_label.winfo_exists():
+                return
+            # The card may also have scrolled away and been rebound
+            still_shown = card['file_info'] is file_info
+            try:
+                photo = ImageTk.PhotoImage(future.result())
+                self._cache_thumbnail(cache_key, photo)
+                if still_shown:
+                    show_photo(photo)
+            except Exception as e:
+                if still_shown:
+                    show_error(e)
+
         try:
-            self.style.configure('ImageCard.TLabel', background=self.palette['light_panel'], foreground=self.palette['text'])
-            self.style.configure('ImageCard.TCheckbutton', background=self.palette['light_panel'], foreground=self.palette['text'])
-            self.style.configure('Card.TLabelframe', background=self.palette['light_panel'])
-            self.style.configure('Card.TLabelframe.Label', background=self.palette['light_panel'], foreground=self.palette['text'])
-        except Exception:
-            pass
+            photo = self._get_cached_thumbnail(cache_key)
+            if photo is not None:
+                show_photo(photo)
+                return
+            # Decode on a worker thread so the UI stays responsive; the
+            # PhotoImage itself has to be created back on the Tk thread
+            future = self.thumb_executor.submit(self._render_thumbnail, file_info)
+            future.add_done_callback(lambda done: self._post_message(
+                {'type': 'thumbnail', 'future': done, 'callback': show_thumbnail}))
+        except Exception as e:
+            show_error(e)
     
     def delete_selected(self):
         """Delete selected duplicate files."""
@@ -1185,17 +2322,7 @@ class ImageDeduplicatorGUI:
                                        f"This action cannot be undone!")
             
             if result:
-                try:
-                    deletion_result = self.delete_visual_selections(files_to_delete)
-                    messagebox.showinfo("Deletion Complete", 
-                                      f"Deleted {deletion_result['deleted']} files.\n"
-                                      f"Errors: {deletion_result['errors']}")
-                    
-                    # Refresh results
-                    self.display_results()
-                    
-                except Exception as e:
-                    messagebox.showerror("Error", f"An error occurred during deletion: {str(e)}")
+                self.delete_visual_selections(files_to_delete)
         else:
             # Use default deletion (all duplicates)
             result = messagebox.askyesno("Confirm Deletion", 
@@ -1203,17 +2330,9 @@ class ImageDeduplicatorGUI:
                                        f"This action cannot be undone!")
             
             if result:
-                try:
-                    deletion_result = self.deduplicator.delete_duplicates()
-                    messagebox.showinfo("Deletion Complete", 
-                                      f"Deleted {deletion_result['deleted']} files.\n"
-                                      f"Errors: {deletion_result['errors']}")
-                    
-                    # Refresh results
-                    self.display_results()
-                    
-                except Exception as e:
-                    messagebox.showerror("Error", f"An error occurred during deletion: {str(e)}")
+                self.delete_visual_selections([file_info['path']
+                                               for group in self.deduplicator.duplicates
+                                               for file_info in group['delete']])
     
     def get_visual_selections(self):
         """Get list of files to delete based on visual selections."""
@@ -1233,25 +2352,61 @@ class ImageDeduplicatorGUI:
         return files_to_delete
     
     def delete_visual_selections(self, files_to_delete):
-        """Delete files based on visual selections."""
+        """Delete files in the background; the outcome arrives as a 'delete_complete' message."""
+        if self.is_scanning:
+            return
+        
+        # Deleting is slow on network drives, so it runs on the scan
+        # executor like a scan does, and the cancel button stops it
+        self.scan_button.config(state='disabled')
+        self.delete_button.config(state='disabled')
+        try:
+            self.cancel_button.config(state='normal', style='cancel_running.TButton')
+        except Exception:
+            self.cancel_button.config(state='normal')
+        self.progress.config(mode='determinate', value=0)
+        self.status_var.set("Deleting files...")
+        
+        self._cancel_event.clear()
+        self.scan_future = self.scan_executor.submit(self._delete_files, files_to_delete)
+        self.scan_future.add_done_callback(self._on_delete_done)
+    
+    def _delete_files(self, files_to_delete):
+        """Worker thread for deleting files, reporting progress as it goes."""
         deleted_count = 0
         error_count = 0
         errors = []
+        total = len(files_to_delete)
+        progress_step = max(1, total // PROGRESS_STEPS)
         
-        for file_path in files_to_delete:
+        for i, file_path in enumerate(files_to_delete):
+            if self._cancel_event.is_set():
+                break
             try:
                 os.remove(file_path)
                 deleted_count += 1
             except (IOError, OSError) as e:
                 error_count += 1
                 errors.append(f"Error deleting {file_path}: {e}")
+            if i % progress_step == 0 or i == total - 1:
+                self._post_message({'type': 'delete_progress', 'current': i + 1, 'total': total})
         
         return {
             'deleted': deleted_count,
             'errors': error_count,
-            'error_list': errors
+            'error_list': errors,
+            'cancelled': self._cancel_event.is_set()
         }
     
+    def _on_delete_done(self, future):
+        """Report a finished deletion to the Tk thread (runs on the worker thread)."""
+        error = future.exception()
+        if error is not None:
+            self._post_message({'type': 'error', 'status': "Deletion failed",
+                                'error': f"An error occurred during deletion: {error}"})
+        else:
+            self._post_message({'type': 'delete_complete', 'result': future.result()})
+    
     def show_comparison(self, group_index, selected_index):
         """Show enhanced side-by-side comparison of images in a group."""
         if not self.deduplicator or group_index >= len(self.deduplicator.duplicates):
@@ -1289,11 +2444,13 @@ class ImageDeduplicatorGUI:
         comparison_window.zoom_var = tk.DoubleVar(value=1.0)
 
         # Zoom slider
+        # Its command fires only on value changes, not on every pointer move
+        # over the slider, and the rebuild waits until dragging pauses
+        comparison_window.zoom_after_id = None
         zoom_scale = ttk.Scale(controls_left, from_=0.5, to=3.0, variable=comparison_window.zoom_var,
-                              orient=tk.HORIZONTAL, length=120)
+                              orient=tk.HORIZONTAL, length=120,
+                              command=lambda value: self.schedule_comparison_zoom(comparison_window))
         zoom_scale.pack(side=tk.LEFT, padx=(0, 5))
-        zoom_scale.bind("<Motion>", lambda e: self.update_comparison_zoom(comparison_window))
-        zoom_scale.bind("<ButtonRelease-1>", lambda e: self.update_comparison_zoom(comparison_window))
 
         # Manual zoom entry
         zoom_entry_frame = ttk.Frame(controls_left)
@@ -1357,10 +2514,34 @@ class ImageDeduplicatorGUI:
         h_scrollbar = ttk.Scrollbar(comparison_area, orient="horizontal", command=canvas.xview)
         scrollable_frame = tk.Frame(canvas, bg=self.palette['panel'])
 
-        # Configure scrolling
-        scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+        # Configure scrolling. Windowed views (large groups) register a
+        # view_listener to hear about every scroll and resize
+        comparison_window.view_listener = None
+
+        def notify_view_change():
+            if comparison_window.view_listener:
+                comparison_window.view_listener()
+
+        def on_yscroll(first, last):
+            v_scrollbar.set(first, last)
+            notify_view_change()
+
+        def on_xscroll(first, last):
+            h_scrollbar.set(first, last)
+            notify_view_change()
+
+        # Rebuilds suspend the scroll-region update and set it once at the end
+        comparison_window.suspend_scrollregion = False
+
+        def update_scrollregion(event):
+            # The frame is the canvas's only item, anchored at the origin
+            if not comparison_window.suspend_scrollregion:
+                canvas.configure(scrollregion=(0, 0, event.width, event.height))
+
+        scrollable_frame.bind("<Configure>", update_scrollregion)
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        canvas.configure(yscrollcommand=on_yscroll, xscrollcommand=on_xscroll)
+        canvas.bind("<Configure>", lambda e: notify_view_change())
 
         # Pack canvas and scrollbars
         canvas.pack(side="left", fill="both", expand=True)
@@ -1371,6 +2552,25 @@ class ImageDeduplicatorGUI:
         comparison_window.canvas = canvas
         comparison_window.scrollable_frame = scrollable_frame
         comparison_window.image_widgets = []
+        comparison_window.photo_cache = OrderedDict()
+        comparison_window.photo_cache_size = None
+        comparison_window.overlay_images = OrderedDict()
+        comparison_window.opacity_after_id = None
+
+        def release_images(event):
+            # Tk frees an image only once its PhotoImage object is gone, and
+            # callbacks still holding this window can keep it alive until the
+            # cycle collector runs; drop the cached images as soon as it closes
+            if event.widget is comparison_window:
+                # Pending slider updates would otherwise fire into a dead window
+                for after_id in (comparison_window.zoom_after_id, comparison_window.opacity_after_id):
+                    if after_id is not None:
+                        comparison_window.after_cancel(after_id)
+                comparison_window.image_widgets.clear()
+                comparison_window.photo_cache.clear()
+                comparison_window.overlay_images.clear()
+
+        comparison_window.bind("<Destroy>", release_images, add="+")
 
         # Create enhanced comparison widgets
         self.create_enhanced_comparison_widgets(comparison_window, group, group_index, selected_index)
@@ -1410,29 +2610,31 @@ class ImageDeduplicatorGUI:
             outer.config(bg=self.palette.get('border', '#1f2a2d'))
             outer.pack_configure(padx=6, pady=4)
         
-        # Image thumbnail (larger for comparison)
-        try:
-            with Image.open(file_info['path']) as img:
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                # Resize to comparison size
-                img.thumbnail((300, 300), Image.Resampling.LANCZOS)
-                
+        # Image thumbnail (larger for comparison), filled in once decoded
+        img_label = ttk.Label(img_frame, text="Loading...")
+        img_label.pack(pady=5)
+        
+        def show_error(e):
+            if img_label.winfo_exists():
+                img_label.configure(text=f"Error loading image:\n{str(e)[:50]}...", image="")
+        
+        def show_preview(img, exif_text):
+            if not img_label.winfo_exists():
+                return
+            try:
                 # Convert to PhotoImage
                 photo = ImageTk.PhotoImage(img)
-                
-                # Display image
-                img_label = ttk.Label(img_frame, image=photo)
-                img_label.image = photo  # Keep reference
-                img_label.pack(pady=5)
-                
-        except Exception as e:
-            error_label = ttk.Label(img_frame, text=f"Error loading image:\n{str(e)[:50]}...")
-            error_label.pack(pady=5)
+            except Exception as e:
+                show_error(e)
+                return
+            img_label.configure(image=photo, text="")
+            img_label.image = photo  # Keep reference
+        
+        # Resized to comparison size (cached across refreshes)
+        self._load_preview(file_info, (PREVIEW_SIZE, PREVIEW_SIZE), show_preview, show_error)
         
         # File info
-        info_text = f"File: {Path(file_info['path']).name}\n"
+        info_text = f"File: {os.path.basename(file_info['path'])}\n"
         info_text += f"Size: {self.deduplicator._format_size(file_info['size'])}\n"
         info_text += f"Dimensions: {file_info['width']}x{file_info['height']}\n"
         info_text += f"Format: {file_info['format']}"
@@ -1506,6 +2708,7 @@ class ImageDeduplicatorGUI:
         # Remove the deleted image from the group
         if deleted_image_index < len(group['files']):
             deleted_file = group['files'].pop(deleted_image_index)
+            self._forget_previews(deleted_file['path'])
             
             # Update statistics
             self.deduplicator.stats['files_to_delete'] -= 1
@@ -1541,11 +2744,33 @@ class ImageDeduplicatorGUI:
         """Create enhanced comparison widgets with delete functionality."""
         view_mode = comparison_window.view_mode.get()
 
+        # Every widget added or removed resizes the frame; hold the scroll
+        # region until the whole view is rebuilt rather than following each
+        # intermediate size
+        comparison_window.suspend_scrollregion = True
+        try:
+            self._build_comparison_view(comparison_window, view_mode, group, group_index, selected_index)
+        finally:
+            comparison_window.suspend_scrollregion = False
+        frame = comparison_window.scrollable_frame
+        frame.update_idletasks()
+        comparison_window.canvas.configure(scrollregion=(0, 0, frame.winfo_reqwidth(), frame.winfo_reqheight()))
+
+    def _build_comparison_view(self, comparison_window, view_mode, group, group_index, selected_index):
+        """Replace the comparison window's image widgets with the given view mode."""
         # Clear existing widgets
         for widget in comparison_window.scrollable_frame.winfo_children():
             widget.destroy()
 
         comparison_window.image_widgets.clear()
+        comparison_window.view_listener = None
+
+        # PhotoImages survive view-mode switches and refreshes; only a new
+        # zoom level makes them stale
+        base_size = int(PREVIEW_SIZE * comparison_window.zoom_var.get())
+        if comparison_window.photo_cache_size != base_size:
+            comparison_window.photo_cache.clear()
+            comparison_window.photo_cache_size = base_size
 
         if view_mode == "Side by Side":
             self.create_side_by_side_view(comparison_window, group, group_index, selected_index)
@@ -1558,6 +2783,11 @@ class ImageDeduplicatorGUI:
         """Create side-by-side comparison view."""
         frame = comparison_window.scrollable_frame
 
+        if len(group['files']) > COMPARISON_EAGER_FILES:
+            self._create_windowed_cells(comparison_window, group, group_index, selected_index,
+                                        columns=len(group['files']))
+            return
+
         for i, file_info in enumerate(group['files']):
             # Create enhanced image widget
             img_widget = self.create_enhanced_image_widget(frame, file_info, i, group_index,
@@ -1574,6 +2804,11 @@ class ImageDeduplicatorGUI:
         cols = min(3, num_files)  # Max 3 columns
         rows = (num_files + cols - 1) // cols
 
+        if num_files > COMPARISON_EAGER_FILES:
+            self._create_windowed_cells(comparison_window, group, group_index, selected_index,
+                                        columns=cols)
+            return
+
         for i, file_info in enumerate(group['files']):
             row = i // cols
             col = i % cols
@@ -1588,6 +2823,95 @@ class ImageDeduplicatorGUI:
             img_widget.grid(row=row, column=col, padx=5, pady=5, sticky="nsew")
             comparison_window.image_widgets.append(img_widget)
 
+    def _create_windowed_cells(self, comparison_window, group, group_index, selected_index, columns):
+        """
+        Lay a group's image widgets out in equal cells, building only those near the view.
+        
+        Each image widget decodes a preview and reads EXIF, so for large
+        groups only the cells within a screen of the visible area exist;
+        the rest are built as they scroll close and destroyed once they are
+        well out of view. Cells grow to fit the largest widget built so far.
+        """
+        canvas = comparison_window.canvas
+        files = group['files']
+        rows = -(-len(files) // columns)
+        pad = 10
+
+        cells_frame = tk.Frame(comparison_window.scrollable_frame, bg=self.palette['panel'])
+        cells_frame.pack(fill=tk.BOTH, expand=True)
+
+        cell_state = {}  # file index -> image widget
+        cell_size = [1, 1]  # width, height
+        refresh = {'busy': False, 'pending': False}
+
+        def place_cell(index, widget):
+            row, col = divmod(index, columns)
+            widget.place(x=col * cell_size[0] + pad, y=row * cell_size[1] + pad,
+                         width=cell_size[0] - 2 * pad, height=cell_size[1] - 2 * pad)
+
+        def fit_cell(widget):
+            # Grow every cell if this widget doesn't fit the current size
+            widget.update_idletasks()
+            width = widget.winfo_reqwidth() + 2 * pad
+            height = widget.winfo_reqheight() + 2 * pad
+            if width > cell_size[0] or height > cell_size[1]:
+                cell_size[0] = max(cell_size[0], width)
+                cell_size[1] = max(cell_size[1], height)
+                cells_frame.configure(width=columns * cell_size[0], height=rows * cell_size[1])
+                for built_index, built in cell_state.items():
+                    place_cell(built_index, built)
+
+        def build_cell(index):
+            widget = self.create_enhanced_image_widget(cells_frame, files[index], index, group_index,
+                                                       selected_index, comparison_window)
+            cell_state[index] = widget
+            comparison_window.image_widgets.append(widget)
+            fit_cell(widget)
+            place_cell(index, widget)
+            # Previews arrive later and may make the widget larger
+            widget.bind('<<PreviewShown>>', lambda event: fit_cell(event.widget))
+
+        def visible_span(start, extent, cell, count):
+            # Cells within one screen either side of the visible range
+            first = max(0, int((start - extent) // cell))
+            last = min(count - 1, int((start + 2 * extent) // cell))
+            return range(first, last + 1)
+
+        def materialize_visible():
+            # Building cells changes the scroll region, which calls back
+            # in here; finish the current pass, then run once more
+            if refresh['busy']:
+                refresh['pending'] = True
+                return
+            if not cells_frame.winfo_exists():
+                return
+            refresh['busy'] = True
+            try:
+                while True:
+                    refresh['pending'] = False
+                    col_range = visible_span(canvas.canvasx(0) - cells_frame.winfo_x(),
+                                             canvas.winfo_width(), cell_size[0], columns)
+                    row_range = visible_span(canvas.canvasy(0) - cells_frame.winfo_y(),
+                                             canvas.winfo_height(), cell_size[1], rows)
+                    wanted = {row * columns + col for row in row_range for col in col_range
+                              if row * columns + col < len(files)}
+
+                    for index in [index for index in cell_state if index not in wanted]:
+                        widget = cell_state.pop(index)
+                        comparison_window.image_widgets.remove(widget)
+                        widget.destroy()
+                    for index in sorted(wanted - cell_state.keys()):
+                        build_cell(index)
+                    if not refresh['pending']:
+                        break
+            finally:
+                refresh['busy'] = False
+
+        # The first cell sets the initial cell size for the visibility maths
+        build_cell(0)
+        comparison_window.view_listener = materialize_visible
+        materialize_visible()
+
     def create_overlay_view(self, comparison_window, group, group_index, selected_index):
         """Create overlay comparison view for detailed pixel comparison."""
         frame = comparison_window.scrollable_frame
@@ -1603,7 +2927,7 @@ class ImageDeduplicatorGUI:
         ttk.Label(controls_top, text="Base Image:").pack(side=tk.LEFT, padx=(0, 5))
         comparison_window.base_image_var = tk.IntVar(value=0)
         base_combo = ttk.Combobox(controls_top, textvariable=comparison_window.base_image_var,
-                                 values=[f"Image {i+1}: {Path(file_info['path']).name[:20]}..."
+                                 values=[f"Image {i+1}: {os.path.basename(file_info['path'])[:20]}..."
                                         for i, file_info in enumerate(group['files'])],
                                  state="readonly", width=25)
         base_combo.pack(side=tk.LEFT, padx=(0, 20))
@@ -1611,7 +2935,7 @@ class ImageDeduplicatorGUI:
         ttk.Label(controls_top, text="Overlay Image:").pack(side=tk.LEFT, padx=(0, 5))
         comparison_window.overlay_image_var = tk.IntVar(value=1 if len(group['files']) > 1 else 0)
         overlay_combo = ttk.Combobox(controls_top, textvariable=comparison_window.overlay_image_var,
-                                    values=[f"Image {i+1}: {Path(file_info['path']).name[:20]}..."
+                                    values=[f"Image {i+1}: {os.path.basename(file_info['path'])[:20]}..."
                                            for i, file_info in enumerate(group['files'])],
                                     state="readonly", width=25)
         overlay_combo.pack(side=tk.LEFT, padx=(0, 20))
@@ -1626,11 +2950,12 @@ class ImageDeduplicatorGUI:
 
         ttk.Label(controls_bottom, text="Overlay Opacity:").pack(side=tk.LEFT, padx=(0, 5))
         comparison_window.opacity_var = tk.DoubleVar(value=0.5)
+        # The scale's command fires only when the value changes (not on every
+        # pointer move over it); renders are then throttled to one per frame
         opacity_scale = ttk.Scale(controls_bottom, from_=0.0, to=1.0, variable=comparison_window.opacity_var,
-                                 orient=tk.HORIZONTAL, length=200)
+                                 orient=tk.HORIZONTAL, length=200,
+                                 command=lambda value: self.schedule_overlay_opacity(comparison_window, group))
         opacity_scale.pack(side=tk.LEFT, padx=(0, 10))
-        opacity_scale.bind("<Motion>", lambda e: self.safe_update_overlay_opacity(comparison_window, group))
-        opacity_scale.bind("<ButtonRelease-1>", lambda e: self.safe_update_overlay_opacity(comparison_window, group))
 
         # Opacity percentage display
         comparison_window.opacity_label = ttk.Label(controls_bottom, text="50%")
@@ -1678,47 +3003,66 @@ class ImageDeduplicatorGUI:
         image_area = ttk.Frame(container)
         image_area.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        # Load and display image with zoom
-        try:
-            zoom_factor = comparison_window.zoom_var.get()
-            base_size = int(300 * zoom_factor)
-
-            with Image.open(file_info['path']) as img:
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-
-                # Calculate display size
-                img.thumbnail((base_size, base_size), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-
-                # Display image
-                img_label = ttk.Label(image_area, image=photo)
-                img_label.image = photo  # Keep reference
-                img_label.pack(pady=5)
-
-        except Exception as e:
-            error_label = ttk.Label(image_area, text=f"Error loading:\n{str(e)[:30]}...")
-            error_label.pack(pady=5)
+        # Image with zoom; filled in once decoded in the background
+        img_label = ttk.Label(image_area, text="Loading...")
+        img_label.pack(pady=5)
 
         # File information
         info_frame = ttk.LabelFrame(container, text="File Information", style='Card.TLabelframe')
         info_frame.pack(fill=tk.X, padx=5, pady=5)
 
         # Basic file info
-        file_name = Path(file_info['path']).name
+        file_name = os.path.basename(file_info['path'])
         info_text = f"Name: {file_name}\n"
         info_text += f"Size: {self.deduplicator._format_size(file_info['size'])}\n"
         info_text += f"Dimensions: {file_info['width']}x{file_info['height']}\n"
         info_text += f"Format: {file_info['format']}"
 
-        # Add EXIF data if available
-        exif_data = self.get_exif_data(file_info['path'])
-        if exif_data:
-            info_text += f"\n\nEXIF Data:\n{exif_data}"
-
         info_label = ttk.Label(info_frame, text=info_text, justify=tk.LEFT, wraplength=280)
         info_label.pack(padx=5, pady=5, anchor="w")
 
+        def show_error(e):
+            if img_label.winfo_exists():
+                img_label.configure(text=f"Error loading:\n{str(e)[:30]}...", image="")
+
+        # Calculate display size (cached per zoom level)
+        zoom_factor = comparison_window.zoom_var.get()
+        base_size = int(PREVIEW_SIZE * zoom_factor)
+        photo_key = (file_info['path'], base_size)
+
+        def show_preview(img, exif_data):
+            if not img_label.winfo_exists():
+                return
+            try:
+                photo = ImageTk.PhotoImage(img)
+            except Exception as e:
+                show_error(e)
+                return
+            photo_cache = comparison_window.photo_cache
+            photo_cache[photo_key] = (photo, exif_data)
+            while len(photo_cache) > PREVIEW_CACHE_SIZE:
+                photo_cache.popitem(last=False)
+            show_photo(photo, exif_data)
+
+        def show_photo(photo, exif_data):
+            # Display image
+            img_label.configure(image=photo, text="")
+            img_label.image = photo  # Keep reference
+
+            # Add EXIF data if available (read along with the preview)
+            if exif_data:
+                info_label.configure(text=f"{info_text}\n\nEXIF Data:\n{exif_data}")
+
+            # Let layouts that size cells from the widget re-measure it
+            container.event_generate('<<PreviewShown>>')
+
+        cached_photo = comparison_window.photo_cache.get(photo_key)
+        if cached_photo is not None:
+            comparison_window.photo_cache.move_to_end(photo_key)
+            show_photo(*cached_photo)
+        else:
+            self._load_preview(file_info, (base_size, base_size), show_preview, show_error)
+
         # Action buttons
         action_frame = ttk.Frame(container)
         action_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -1774,27 +3118,6 @@ class ImageDeduplicatorGUI:
                 except Exception as e:
                     messagebox.showerror("Error", f"Failed to delete {file_name}:\n{str(e)}")
 
-    def get_exif_data(self, file_path):
-        """Extract and format EXIF data from image."""
-        try:
-            import exifread
-            with open(file_path, 'rb') as f:
-                tags = exifread.process_file(f, details=False)
-
-            # Extract useful EXIF data
-            exif_info = []
-            interesting_tags = ['DateTime', 'EXIF DateTime', 'Camera', 'Image Make', 'Image Model',
-                              'EXIF FNumber', 'EXIF ExposureTime', 'EXIF ISOSpeedRatings']
-
-            for tag in interesting_tags:
-                if tag in tags:
-                    exif_info.append(f"{tag}: {tags[tag]}")
-
-            return "\n".join(exif_info[:4])  # Limit to 4 lines
-
-        except Exception:
-            return None
-
     def calculate_group_similarity(self, group):
         """Calculate similarity percentage for a group of images."""
         if len(group['files']) < 2:
@@ -1839,18 +3162,17 @@ class ImageDeduplicatorGUI:
 
     def open_image_folder(self, file_path):
         """Open the folder containing the image."""
-        import subprocess
-        import platform
-
         folder_path = str(Path(file_path).parent)
 
+        # Popen rather than run: the file manager is left to start on its
+        # own instead of stalling the UI until the launcher exits
         try:
-            if platform.system() == "Windows":
-                subprocess.run(["explorer", "/select,", file_path])
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.run(["open", "-R", file_path])
+            if _SYSTEM == "Windows":
+                subprocess.Popen(["explorer", "/select,", file_path])
+            elif _SYSTEM == "Darwin":  # macOS
+                subprocess.Popen(["open", "-R", file_path], stdout=subprocess.DEVNULL)
             else:  # Linux
-                subprocess.run(["xdg-open", folder_path])
+                subprocess.Popen(["xdg-open", folder_path], stdout=subprocess.DEVNULL)
         except Exception as e:
             messagebox.showerror("Error", f"Could not open folder:\n{str(e)}")
 
@@ -1860,32 +3182,32 @@ class ImageDeduplicatorGUI:
         for file_info in group['files']:
             folders.add(str(Path(file_info['path']).parent))
 
+        # Launch every file manager without waiting on the previous one so the
+        # folders open concurrently instead of one after another
         for folder in folders:
             try:
-                import subprocess
-                import platform
-
-                if platform.system() == "Windows":
-                    subprocess.run(["explorer", folder])
-                elif platform.system() == "Darwin":  # macOS
-                    subprocess.run(["open", folder])
+                if _SYSTEM == "Windows":
+                    subprocess.Popen(["explorer", folder])
+                elif _SYSTEM == "Darwin":  # macOS
+                    subprocess.Popen(["open", folder])
                 else:  # Linux
-                    subprocess.run(["xdg-open", folder])
+                    subprocess.Popen(["xdg-open", folder])
             except Exception:
                 pass  # Silently continue if one fails
 
     def view_full_size(self, file_path):
         """Open image in full size view."""
         try:
-            import subprocess
-            import platform
-
-            if platform.system() == "Windows":
-                subprocess.run(["start", "", file_path], shell=True)
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.run(["open", file_path])
+            if _SYSTEM == "Windows":
+                # Hand the file straight to the shell association instead of
+                # spawning cmd.exe just to run its "start" builtin
+                os.startfile(file_path)
+            elif _SYSTEM == "Darwin":  # macOS
+                subprocess.Popen(["open", file_path], stdout=subprocess.DEVNULL)
             else:  # Linux
-                subprocess.run(["xdg-open", file_path])
+                # Don't wait: xdg-open can block for as long as the viewer it
+                # launches stays open
+                subprocess.Popen(["xdg-open", file_path], stdout=subprocess.DEVNULL)
         except Exception as e:
             messagebox.showerror("Error", f"Could not open image:\n{str(e)}")
 
@@ -1918,253 +3240,207 @@ class ImageDeduplicatorGUI:
         ttk.Button(button_frame, text="Cancel", command=export_window.destroy).pack(side=tk.LEFT, padx=10)
 
     def perform_export(self, group, format_type, export_window):
-        """Perform the actual export operation."""
-        from tkinter import filedialog
-        import json
-        import csv
-
+        """Ask where to export the group, then write the file in the background."""
         if format_type == "JSON":
             file_path = filedialog.asksaveasfilename(defaultextension=".json",
                                                     filetypes=[("JSON files", "*.json")])
-            if file_path:
-                with open(file_path, 'w') as f:
-                    json.dump(group, f, indent=2, default=str)
+            writer = _write_json
 
         elif format_type == "CSV":
             file_path = filedialog.asksaveasfilename(defaultextension=".csv",
                                                     filetypes=[("CSV files", "*.csv")])
-            if file_path:
-                with open(file_path, 'w', newline='') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(['Index', 'Filename', 'Path', 'Size', 'Width', 'Height', 'Format'])
-                    for i, file_info in enumerate(group['files']):
-                        writer.writerow([i+1, Path(file_info['path']).name, file_info['path'],
-                                       file_info['size'], file_info['width'], file_info['height'],
-                                       file_info['format']])
+            writer = self._write_csv
 
         elif format_type == "PDF Report":
             file_path = filedialog.asksaveasfilename(defaultextension=".pdf",
                                                     filetypes=[("PDF files", "*.pdf")])
-            if file_path:
-                self.create_pdf_report(group, file_path)
+            writer = self.create_pdf_report
 
         elif format_type == "HTML Report":
             file_path = filedialog.asksaveasfilename(defaultextension=".html",
                                                     filetypes=[("HTML files", "*.html")])
-            if file_path:
-                self.create_html_report(group, file_path)
+            writer = self.create_html_report
 
         elif format_type == "Text Summary":
             file_path = filedialog.asksaveasfilename(defaultextension=".txt",
                                                     filetypes=[("Text files", "*.txt")])
-            if file_path:
-                self.create_text_summary(group, file_path)
+            writer = self.create_text_summary
+
+        else:
+            file_path = None
 
         export_window.destroy()
-        messagebox.showinfo("Success", f"Exported successfully to {format_type} format!")
+        if not file_path:
+            return
+
+        # Write from a snapshot: deletions on the Tk thread edit the group's
+        # file lists in place while the export runs
+        snapshot = dict(group, files=list(group['files']), delete=list(group['delete']))
+        future = self.export_executor.submit(self._write_export, writer, snapshot, file_path)
+        future.add_done_callback(lambda done: self._post_message(
+            {'type': 'export_complete', 'future': done, 'format': format_type}))
+
+    @staticmethod
+    def _write_export(writer, group, file_path):
+        """Run an export writer, leaving either the complete file or the old one."""
+        # Reports are streamed out piece by piece, so they are written under
+        # a temporary name and renamed into place only once they are complete
+        file_path = Path(file_path)
+        temp_file = file_path.with_name(f"{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            writer(group, str(temp_file))
+            os.replace(temp_file, file_path)
+        except Exception:
+            try:
+                temp_file.unlink()
+            except OSError:
+                pass
+            raise
+
+    def _write_csv(self, group, file_path):
+        """Write the group's files as CSV rows."""
+        with open(file_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Index', 'Filename', 'Path', 'Size', 'Width', 'Height', 'Format'])
+            for i, file_info in enumerate(group['files']):
+                writer.writerow([i+1, os.path.basename(file_info['path']), file_info['path'],
+                               file_info['size'], file_info['width'], file_info['height'],
+                               file_info['format']])
 
     def create_pdf_report(self, group, file_path):
-        """Create a comprehensive PDF report for the duplicate group."""
+        """
+        Create a comprehensive PDF report for the duplicate group.
+        
+        Runs on the export worker, so failures are raised for the Tk thread
+        to report rather than shown here.
+        """
         try:
             from reportlab.lib.pagesizes import letter, A4
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image as ReportLabImage, Table, TableStyle
+            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image as ReportLabImage, Table, LongTable, TableStyle
             from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
             from reportlab.lib.units import inch
             from reportlab.lib import colors
             from reportlab.lib.enums import TA_CENTER, TA_LEFT
-            import datetime
-
-            # Create document
-            doc = SimpleDocTemplate(file_path, pagesize=A4)
-            styles = getSampleStyleSheet()
-            story = []
-
-            # Title
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=18,
-                alignment=TA_CENTER,
-                spaceAfter=30
-            )
-            story.append(Paragraph("Image Deduplicator - Duplicate Group Report", title_style))
-            story.append(Spacer(1, 20))
-
-            # Report info
-            report_info = [
-                ['Report Generated:', datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
-                ['Group Type:', group['type'].title() + ' Duplicates'],
-                ['Number of Files:', str(len(group['files']))],
-                ['Space to Save:', self.deduplicator._format_size(group['space_saved'])]
-            ]
-
-            info_table = Table(report_info, colWidths=[2*inch, 3*inch])
-            info_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, -1), colors.lightgrey),
-                ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
-            story.append(info_table)
-            story.append(Spacer(1, 20))
-
-            # Files section
-            story.append(Paragraph("File Details", styles['Heading2']))
-            story.append(Spacer(1, 10))
-
-            # Create file table
-            file_data = [['#', 'Filename', 'Size', 'Dimensions', 'Format', 'Action']]
-            for i, file_info in enumerate(group['files']):
-                action = "KEEP" if i == 0 else "Delete"
-                file_data.append([
-                    str(i + 1),
-                    Path(file_info['path']).name[:25] + '...' if len(Path(file_info['path']).name) > 25 else Path(file_info['path']).name,
-                    self.deduplicator._format_size(file_info['size']),
-                    f"{file_info['width']}x{file_info['height']}",
-                    file_info['format'],
-                    action
-                ])
-
-            file_table = Table(file_data, colWidths=[0.5*inch, 2.5*inch, 1*inch, 1*inch, 0.8*inch, 0.8*inch])
-            file_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 8),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                # Highlight keep vs delete actions
-                ('BACKGROUND', (5, 1), (5, 1), colors.lightgreen),  # KEEP
-                ('BACKGROUND', (5, 2), (5, -1), colors.lightyellow),  # Delete
-            ]))
-            story.append(file_table)
-            story.append(Spacer(1, 20))
-
-            # Recommendations section
-            story.append(Paragraph("Recommendations", styles['Heading2']))
-            story.append(Spacer(1, 10))
-
-            recommendations = [
-                f"• Keep the largest file: {Path(group['keep']['path']).name}",
-                f"• Delete {len(group['delete'])} duplicate files",
-                f"• Total space savings: {self.deduplicator._format_size(group['space_saved'])}",
-                f"• Always backup important files before deletion"
-            ]
-
-            for rec in recommendations:
-                story.append(Paragraph(rec, styles['Normal']))
-                story.append(Spacer(1, 5))
-
-            # Footer
-            story.append(Spacer(1, 30))
-            footer_style = ParagraphStyle(
-                'Footer',
-                parent=styles['Normal'],
-                fontSize=8,
-                alignment=TA_CENTER,
-                textColor=colors.grey
-            )
-            story.append(Paragraph("Generated by Image Deduplicator - Enhanced UI/UX Edition", footer_style))
+        except ImportError:
+            raise RuntimeError("ReportLab library not available. Please install: pip install reportlab") from None
 
-            # Build PDF
-            doc.build(story)
+        # Shown in both the summary table and the recommendations
+        space_saved = self.deduplicator._format_size(group['space_saved'])
 
-        except ImportError:
-            messagebox.showerror("Error", "ReportLab library not available. Please install: pip install reportlab")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to create PDF: {str(e)}")
+        # Create document
+        doc = SimpleDocTemplate(file_path, pagesize=A4)
+        styles = getSampleStyleSheet()
+        story = []
+
+        # Title
+        title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=18,
+            alignment=TA_CENTER,
+            spaceAfter=30
+        )
+        story.append(Paragraph("Image Deduplicator - Duplicate Group Report", title_style))
+        story.append(Spacer(1, 20))
+
+        # Report info
+        report_info = [
+            ['Report Generated:', datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
+            ['Group Type:', group['type'].title() + ' Duplicates'],
+            ['Number of Files:', str(len(group['files']))],
+            ['Space to Save:', space_saved]
+        ]
+
+        info_table = Table(report_info, colWidths=[2*inch, 3*inch])
+        info_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), colors.lightgrey),
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+        ]))
+        story.append(info_table)
+        story.append(Spacer(1, 20))
+
+        # Files section
+        story.append(Paragraph("File Details", styles['Heading2']))
+        story.append(Spacer(1, 10))
+
+        # Create file table
+        file_data = [['#', 'Filename', 'Size', 'Dimensions', 'Format', 'Action']]
+        for i, file_info in enumerate(group['files']):
+            action = "KEEP" if i == 0 else "Delete"
+            name = os.path.basename(file_info['path'])
+            file_data.append([
+                str(i + 1),
+                name[:25] + '...' if len(name) > 25 else name,
+                self.deduplicator._format_size(file_info['size']),
+                f"{file_info['width']}x{file_info['height']}",
+                file_info['format'],
+                action
+            ])
+
+        # LongTable lays long groups out in linear time when they span
+        # pages, and the header row repeats on every page
+        file_table = LongTable(file_data, colWidths=[0.5*inch, 2.5*inch, 1*inch, 1*inch, 0.8*inch, 0.8*inch],
+                               repeatRows=1)
+        file_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            # Highlight keep vs delete actions
+            ('BACKGROUND', (5, 1), (5, 1), colors.lightgreen),  # KEEP
+            ('BACKGROUND', (5, 2), (5, -1), colors.lightyellow),  # Delete
+        ]))
+        story.append(file_table)
+        story.append(Spacer(1, 20))
+
+        # Recommendations section
+        story.append(Paragraph("Recommendations", styles['Heading2']))
+        story.append(Spacer(1, 10))
+
+        recommendations = [
+            f"• Keep the largest file: {os.path.basename(group['keep']['path'])}",
+            f"• Delete {len(group['delete'])} duplicate files",
+            f"• Total space savings: {space_saved}",
+            f"• Always backup important files before deletion"
+        ]
+
+        for rec in recommendations:
+            story.append(Paragraph(rec, styles['Normal']))
+            story.append(Spacer(1, 5))
+
+        # Footer
+        story.append(Spacer(1, 30))
+        footer_style = ParagraphStyle(
+            'Footer',
+            parent=styles['Normal'],
+            fontSize=8,
+            alignment=TA_CENTER,
+            textColor=colors.grey
+        )
+        story.append(Paragraph(REPORT_FOOTER, footer_style))
+
+        # Build PDF
+        doc.build(story)
 
     def create_html_report(self, group, file_path):
         """Create an HTML report for the duplicate group."""
-        import datetime
-
-        html_content = f"""
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Image Deduplicator - Duplicate Group Report</title>
-            <style>
-                body {{
-                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                    margin: 40px;
-                    background-color: #f5f5f5;
-                    color: #333;
-                }}
-                .container {{
-                    max-width: 1200px;
-                    margin: 0 auto;
-                    background: white;
-                    padding: 30px;
-                    border-radius: 8px;
-                    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-                }}
-                .header {{
-                    text-align: center;
-                    margin-bottom: 30px;
-                    padding-bottom: 20px;
-                    border-bottom: 2px solid #007bff;
-                }}
-                .info-grid {{
-                    display: grid;
-                    grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-                    gap: 20px;
-                    margin-bottom: 30px;
-                }}
-                .info-card {{
-                    background: #f8f9fa;
-                    padding: 15px;
-                    border-radius: 5px;
-                    border-left: 4px solid #007bff;
-                }}
-                table {{
-                    width: 100%;
-                    border-collapse: collapse;
-                    margin: 20px 0;
-                }}
-                th, td {{
-                    padding: 12px;
-                    text-align: left;
-                    border-bottom: 1px solid #ddd;
-                }}
-                th {{
-                    background-color: #007bff;
-                    color: white;
-                    font-weight: bold;
-                }}
-                tr:hover {{
-                    background-color: #f5f5f5;
-                }}
-                .keep {{
-                    background-color: #d4edda !important;
-                    color: #155724;
-                }}
-                .delete {{
-                    background-color: #f8d7da !important;
-                    color: #721c24;
-                }}
-                .recommendations {{
-                    background: #e9ecef;
-                    padding: 20px;
-                    border-radius: 5px;
-                    margin-top: 30px;
-                }}
-                .footer {{
-                    text-align: center;
-                    margin-top: 40px;
-                    padding-top: 20px;
-                    border-top: 1px solid #dee2e6;
-                    color: #6c757d;
-                    font-size: 0.9em;
-                }}
-            </style>
-        </head>
+        # Shown in both the summary cards and the recommendations
+        space_saved = self.deduplicator._format_size(group['space_saved'])
+
+        # Written piece by piece rather than grown by += (which copies the
+        # whole report again for every row)
+        with open(file_path, 'w', encoding='utf-8', buffering=REPORT_WRITE_BUFFER) as f:
+            f.write(_HTML_REPORT_HEAD)
+            f.write(f"""
         <body>
             <div class="container">
                 <div class="header">
@@ -2187,7 +3463,7 @@ class ImageDeduplicatorGUI:
                     </div>
                     <div class="info-card">
                         <strong>Space to Save:</strong><br>
-                        {self.deduplicator._format_size(group['space_saved'])}
+                        {space_saved}
                     </div>
                 </div>
 
@@ -2205,89 +3481,85 @@ class ImageDeduplicatorGUI:
                         </tr>
                     </thead>
                     <tbody>
-        """
+        """)
 
-        for i, file_info in enumerate(group['files']):
-            action = "KEEP" if i == 0 else "DELETE"
-            row_class = "keep" if i == 0 else "delete"
-            html_content += f"""
+            for i, file_info in enumerate(group['files']):
+                action = "KEEP" if i == 0 else "DELETE"
+                row_class = "keep" if i == 0 else "delete"
+                f.write(f"""
                         <tr class="{row_class}">
                             <td>{i + 1}</td>
-                            <td>{Path(file_info['path']).name}</td>
+                            <td>{os.path.basename(file_info['path'])}</td>
                             <td style="font-size: 0.8em; color: #666;">{file_info['path']}</td>
                             <td>{self.deduplicator._format_size(file_info['size'])}</td>
                             <td>{file_info['width']} × {file_info['height']}</td>
                             <td>{file_info['format']}</td>
                             <td><strong>{action}</strong></td>
                         </tr>
-            """
+            """)
 
-        html_content += f"""
+            f.write(f"""
                     </tbody>
                 </table>
 
                 <div class="recommendations">
                     <h3>Recommendations</h3>
                     <ul>
-                        <li>Keep the largest file: <strong>{Path(group['keep']['path']).name}</strong></li>
+                        <li>Keep the largest file: <strong>{os.path.basename(group['keep']['path'])}</strong></li>
                         <li>Delete {len(group['delete'])} duplicate files</li>
-                        <li>Total space savings: <strong>{self.deduplicator._format_size(group['space_saved'])}</strong></li>
+                        <li>Total space savings: <strong>{space_saved}</strong></li>
                         <li>Always backup important files before deletion</li>
                     </ul>
                 </div>
 
                 <div class="footer">
-                    Generated by Image Deduplicator - Enhanced UI/UX Edition
+                    {REPORT_FOOTER}
                 </div>
             </div>
         </body>
         </html>
-        """
-
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        """)
 
     def create_text_summary(self, group, file_path):
         """Create a simple text summary for the duplicate group."""
-        import datetime
+        # Shown in both the header and the recommendations
+        space_saved = self.deduplicator._format_size(group['space_saved'])
 
-        summary = f"""
+        with open(file_path, 'w', encoding='utf-8', buffering=REPORT_WRITE_BUFFER) as f:
+            f.write(f"""
 IMAGE DEDUPLICATOR - DUPLICATE GROUP SUMMARY
 {'='*50}
 
 Report Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 Group Type: {group['type'].title()} Duplicates
 Number of Files: {len(group['files'])}
-Space to Save: {self.deduplicator._format_size(group['space_saved'])}
+Space to Save: {space_saved}
 
 FILE DETAILS:
 {'-'*50}
-"""
+""")
 
-        for i, file_info in enumerate(group['files']):
-            action = "KEEP" if i == 0 else "DELETE"
-            summary += f"""
-{i + 1}. {Path(file_info['path']).name}
+            for i, file_info in enumerate(group['files']):
+                action = "KEEP" if i == 0 else "DELETE"
+                f.write(f"""
+{i + 1}. {os.path.basename(file_info['path'])}
    Path: {file_info['path']}
    Size: {self.deduplicator._format_size(file_info['size'])}
    Dimensions: {file_info['width']} × {file_info['height']}
    Format: {file_info['format']}
    Action: {action}
-"""
+""")
 
-        summary += f"""
+            f.write(f"""
 RECOMMENDATIONS:
 {'-'*50}
-• Keep the largest file: {Path(group['keep']['path']).name}
+• Keep the largest file: {os.path.basename(group['keep']['path'])}
 • Delete {len(group['delete'])} duplicate files
-• Total space savings: {self.deduplicator._format_size(group['space_saved'])}
+• Total space savings: {space_saved}
 • Always backup important files before deletion
 
-Generated by Image Deduplicator - Enhanced UI/UX Edition
-        """
-
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(summary)
+{REPORT_FOOTER}
+        """)
 
     def update_overlay_display(self, comparison_window, group):
         """Update the overlay display with current settings."""
@@ -2334,7 +3606,10 @@ Generated by Image Deduplicator - Enhanced UI/UX Edition
                 comparison_window.zoom_var.set(zoom)
 
             # Create overlay image
-            overlay_image = self.create_overlay_image(base_file['path'], overlay_file['path'], opacity, zoom)
+            display_size = int(400 * zoom)
+            base_img, overlay_img = self._overlay_images(comparison_window, base_file['path'],
+                                                         overlay_file['path'], display_size)
+            overlay_image = self.create_overlay_image(base_img, overlay_img, opacity)
 
             if overlay_image:
                 # Display the overlay
@@ -2343,8 +3618,8 @@ Generated by Image Deduplicator - Enhanced UI/UX Edition
                 img_label.pack(expand=True)
 
                 # Add info below
-                info_text = f"Base: {Path(base_file['path']).name}\n"
-                info_text += f"Overlay: {Path(overlay_file['path']).name}\n"
+                info_text = f"Base: {os.path.basename(base_file['path'])}\n"
+                info_text += f"Overlay: {os.path.basename(overlay_file['path'])}\n"
                 info_text += f"Opacity: {int(opacity * 100)}%"
 
                 info_label = ttk.Label(comparison_window.overlay_display_frame, text=info_text,
@@ -2357,52 +3632,64 @@ Generated by Image Deduplicator - Enhanced UI/UX Edition
                                   text=f"Error creating overlay: {str(e)[:100]}...")
             error_label.pack(pady=20)
 
-    def create_overlay_image(self, base_path, overlay_path, opacity, zoom_factor):
-        """Create an overlay image from two source images."""
-        try:
-            # Load both images
-            with Image.open(base_path) as base_img:
-                with Image.open(overlay_path) as overlay_img:
-                    # Convert to RGBA for transparency support
-                    base_img = base_img.convert('RGBA')
-                    overlay_img = overlay_img.convert('RGBA')
-
-                    # Get the maximum dimensions
-                    max_width = max(base_img.width, overlay_img.width)
-                    max_height = max(base_img.height, overlay_img.height)
-
-                    # Create a new image with the maximum dimensions
-                    result = Image.new('RGBA', (max_width, max_height), (255, 255, 255, 0))
-
-                    # Resize base image to fit if needed and paste it
-                    if base_img.size != (max_width, max_height):
-                        base_img = base_img.resize((max_width, max_height), Image.Resampling.LANCZOS)
-                    result.paste(base_img, (0, 0))
-
-                    # Resize overlay image to fit if needed
-                    if overlay_img.size != (max_width, max_height):
-                        overlay_img = overlay_img.resize((max_width, max_height), Image.Resampling.LANCZOS)
-
-                    # Apply opacity to overlay image
-                    overlay_alpha = int(255 * opacity)
-                    overlay_img.putalpha(overlay_alpha)
-
-                    # Composite the images
-                    result = Image.alpha_composite(result, overlay_img)
-
-                    # Convert back to RGB
-                    result = result.convert('RGB')
-
-                    # Apply zoom and create display-sized image
-                    display_size = int(400 * zoom_factor)
-                    result.thumbnail((display_size, display_size), Image.Resampling.LANCZOS)
-
-                    # Convert to PhotoImage
-                    return ImageTk.PhotoImage(result)
-
-        except Exception as e:
-            print(f"Error creating overlay: {e}")
-            return None
+    def _overlay_images(self, comparison_window, base_path, overlay_path, display_size):
+        """
+        Return the overlay pair as equally sized, display-sized RGB images.
+        
+        Both images are decoded and scaled once per pair and zoom level and
+        kept on the comparison window (the last OVERLAY_CACHE_SIZE pairs), so
+        opacity changes and the difference map reuse the small copies; the
+        full decoded images are never kept. Zooming out shrinks a larger
+        cached copy of the pair instead of decoding the files again.
+        """
+        key = (base_path, overlay_path, display_size)
+        overlay_images = comparison_window.overlay_images
+        images = overlay_images.get(key)
+        if images is None:
+            larger = [(size, pair) for (base, overlay, size), pair in overlay_images.items()
+                      if base == base_path and overlay == overlay_path and size > display_size]
+            if larger:
+                base_img, overlay_img = min(larger, key=lambda entry: entry[0])[1]
+                scale = min(1.0, display_size / base_img.width, display_size / base_img.height)
+                size = (max(1, round(base_img.width * scale)), max(1, round(base_img.height * scale)))
+                # Bilinear is enough for shrinking an already filtered copy
+                images = [img.resize(size, Image.Resampling.BILINEAR) for img in (base_img, overlay_img)]
+            else:
+                images = self._decode_image_pair(base_path, overlay_path, display_size)
+            overlay_images[key] = images
+            while len(overlay_images) > OVERLAY_CACHE_SIZE:
+                overlay_images.popitem(last=False)
+        else:
+            overlay_images.move_to_end(key)
+        return images
+
+    def _decode_image_pair(self, base_path, overlay_path, display_size):
+        """Decode two images as RGB images of one common size fitting a display_size box."""
+        with Image.open(base_path) as base_img, Image.open(overlay_path) as overlay_img:
+            # Stretch both to the larger of the two sizes, fitted to the display box
+            width = max(base_img.width, overlay_img.width)
+            height = max(base_img.height, overlay_img.height)
+            scale = min(1.0, display_size / width, display_size / height)
+            size = (max(1, round(width * scale)), max(1, round(height * scale)))
+            return [self._decode_rgb_image(img, size) for img in (base_img, overlay_img)]
+
+    @staticmethod
+    def _decode_rgb_image(img, size):
+        """Decode an open image to an RGB copy resized to exactly size."""
+        # Let JPEGs decode at the smallest DCT scale still covering size, and
+        # skip convert() when already RGB (it would only make a full copy)
+        img.draft('RGB', size)
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        # Bilinear, like shrinking a cached pair: about half the cost of
+        # Lanczos, and Pillow widens its filter when shrinking, so it still
+        # averages the whole source area instead of aliasing
+        return img.resize(size, Image.Resampling.BILINEAR)
+
+    def create_overlay_image(self, base_img, overlay_img, opacity):
+        """Blend two equally sized RGB images at the given overlay opacity."""
+        # One pass in Pillow's C core, with no intermediate arrays
+        return ImageTk.PhotoImage(Image.blend(base_img, overlay_img, opacity))
 
     def update_overlay_opacity(self, comparison_window, group):
         """Update overlay opacity and refresh display."""
@@ -2426,6 +3713,19 @@ Generated by Image Deduplicator - Enhanced UI/UX Edition
         comparison_window.opacity_var.set(opacity)
         self.update_overlay_display(comparison_window, group)
 
+    def schedule_overlay_opacity(self, comparison_window, group):
+        """Queue an overlay opacity update, coalescing slider moves within a frame."""
+        if comparison_window.opacity_after_id is not None:
+            return  # the pending update reads the latest value
+
+        def run():
+            comparison_window.opacity_after_id = None
+            # The window or the overlay view may have gone in the meantime
+            if comparison_window.overlay_display_frame.winfo_exists():
+                self.safe_update_overlay_opacity(comparison_window, group)
+
+        comparison_window.opacity_after_id = comparison_window.after(OVERLAY_REFRESH_MS, run)
+
     def safe_update_overlay_opacity(self, comparison_window, group):
         """Safely update overlay opacity with better error handling."""
         try:
@@ -2449,9 +3749,11 @@ Generated by Image Deduplicator - Enhanced UI/UX Edition
             base_file = group['files'][base_idx]
             overlay_file = group['files'][overlay_idx]
 
-            # Create difference image
-            diff_image = self.create_difference_image(base_file['path'], overlay_file['path'],
-                                                    comparison_window.zoom_var.get())
+            # Create difference image from the same display-sized pair as the overlay
+            display_size = int(400 * comparison_window.zoom_var.get())
+            base_img, overlay_img = self._overlay_images(comparison_window, base_file['path'],
+                                                         overlay_file['path'], display_size)
+            diff_image = self.create_difference_image(base_img, overlay_img)
 
             if diff_image:
                 # Clear existing display
@@ -2464,7 +3766,7 @@ Generated by Image Deduplicator - Enhanced UI/UX Edition
                 img_label.pack(expand=True)
 
                 # Add info
-                info_text = f"Differences between:\n{Path(base_file['path']).name}\nand {Path(overlay_file['path']).name}\n"
+                info_text = f"Differences between:\n{os.path.basename(base_file['path'])}\nand {os.path.basename(overlay_file['path'])}\n"
                 info_text += "Red areas show differences"
 
                 info_label = ttk.Label(comparison_window.overlay_display_frame, text=info_text,
@@ -2478,53 +3780,33 @@ Generated by Image Deduplicator - Enhanced UI/UX Edition
         except Exception as e:
             messagebox.showerror("Error", f"Could not create difference map: {str(e)}")
 
-    def create_difference_image(self, base_path, overlay_path, zoom_factor):
-        """Create an image highlighting differences between two images."""
+    def create_difference_image(self, base_img, overlay_img):
+        """Create an image highlighting differences between two equally sized RGB images."""
         try:
-            import numpy as np
-
-            # Load both images
-            with Image.open(base_path) as base_img:
-                with Image.open(overlay_path) as overlay_img:
-                    # Convert to RGB and resize to same dimensions
-                    base_img = base_img.convert('RGB')
-                    overlay_img = overlay_img.convert('RGB')
-
-                    # Resize to match
-                    max_width = max(base_img.width, overlay_img.width)
-                    max_height = max(base_img.height, overlay_img.height)
-
-                    base_img = base_img.resize((max_width, max_height), Image.Resampling.LANCZOS)
-                    overlay_img = overlay_img.resize((max_width, max_height), Image.Resampling.LANCZOS)
-
-                    # Convert to numpy arrays
-                    base_array = np.array(base_img)
-                    overlay_array = np.array(overlay_img)
+            # Both are already shrunk to the display size; the map is only
+            # ever shown at that size
+            base_array = np.asarray(base_img)
+            overlay_array = np.asarray(overlay_img)
+
+            # Absolute difference without widening to int16: max - min
+            # never underflows in uint8
+            diff_array = np.maximum(base_array, overlay_array)
+            diff_array -= np.minimum(base_array, overlay_array)
+
+            # Create difference threshold (adjust sensitivity); OR the
+            # per-channel tests rather than reduce over the strided
+            # channel axis, which is several times slower
+            threshold = 30
+            diff_mask = diff_array[..., 0] > threshold
+            diff_mask |= diff_array[..., 1] > threshold
+            diff_mask |= diff_array[..., 2] > threshold
+
+            # Create colored difference image
+            result_array = base_array.copy()
+            result_array[diff_mask] = [255, 0, 0]  # Red for differences
+
+            return ImageTk.PhotoImage(Image.fromarray(result_array))
 
-                    # Calculate absolute difference
-                    diff_array = np.abs(base_array.astype(np.int16) - overlay_array.astype(np.int16))
-
-                    # Create difference threshold (adjust sensitivity)
-                    threshold = 30
-                    diff_mask = np.any(diff_array > threshold, axis=2)
-
-                    # Create colored difference image
-                    result_array = base_array.copy()
-                    result_array[diff_mask] = [255, 0, 0]  # Red for differences
-
-                    # Convert back to PIL Image
-                    result = Image.fromarray(result_array.astype(np.uint8))
-
-                    # Apply zoom and create display-sized image
-                    display_size = int(400 * zoom_factor)
-                    result.thumbnail((display_size, display_size), Image.Resampling.LANCZOS)
-
-                    return ImageTk.PhotoImage(result)
-
-        except ImportError:
-            messagebox.showwarning("Feature Unavailable",
-                                 "Difference highlighting requires NumPy.\nInstall with: pip install numpy")
-            return None
         except Exception as e:
             print(f"Error creating difference image: {e}")
             return None
@@ -2535,12 +3817,28 @@ Generated by Image Deduplicator - Enhanced UI/UX Edition
             zoom_value = float(comparison_window.zoom_entry_var.get())
             # Clamp to valid range
             zoom_value = max(0.1, min(5.0, zoom_value))
+            # Re-entering the current zoom must not rebuild the view. Compare
+            # numbers: the entry shows one decimal, and the slider can leave
+            # a zoom such as 1.04 that typing 1.0 should snap to
+            if abs(zoom_value - comparison_window.zoom_var.get()) < 1e-6:
+                return
             comparison_window.zoom_var.set(zoom_value)
             self.update_comparison_zoom(comparison_window)
         except ValueError:
             # Invalid input, reset to current value
             comparison_window.zoom_entry_var.set(f"{comparison_window.zoom_var.get():.1f}")
 
+    def schedule_comparison_zoom(self, comparison_window):
+        """Rebuild the comparison view for the slider's zoom once it stops moving."""
+        if comparison_window.zoom_after_id is not None:
+            comparison_window.after_cancel(comparison_window.zoom_after_id)
+
+        def run():
+            comparison_window.zoom_after_id = None
+            self.update_comparison_zoom(comparison_window)
+
+        comparison_window.zoom_after_id = comparison_window.after(ZOOM_SETTLE_MS, run)
+
     def sync_zoom_entry(self, comparison_window):
         """Sync zoom entry field with slider value."""
         zoom_value = comparison_window.zoom_var.get()
@@ -2561,6 +3859,13 @@ Generated by Image Deduplicator - Enhanced UI/UX Edition
     def run(self):
         """Start the GUI application."""
         self.root.mainloop()
+        self._closed = True
+        # Let a scan still running stop at its next file rather than hold
+        # up interpreter exit
+        self._cancel_event.set()
+        self.scan_executor.shutdown(wait=False)
+        # Finish exports already requested rather than abandon them
+        self.export_executor.shutdown(wait=True)
 
 
 def main():
@@ -2583,6 +3888,12 @@ Examples:
     parser.add_argument('--no-dry-run', action='store_true', 
                        help='Actually delete files (default is dry run)')
     parser.add_argument('--output', help='Save results to JSON file')
+    parser.add_argument('--jobs', type=int, default=None,
+                       help='Number of parallel hashing workers (default: CPU count)')
+    parser.add_argument('--cache', action='store_true',
+                       help=f'Reuse hashes of unchanged files from earlier runs (stored in {HASH_CACHE_PATH})')
+    parser.add_argument('--opencv', action='store_true',
+                       help='Decode images with OpenCV for faster hashing (requires opencv-python)')
     
     args = parser.parse_args()
     
@@ -2602,16 +3913,26 @@ Examples:
         parser.print_help()
         return
     
+    if args.opencv and not CV2_AVAILABLE:
+        print("Warning: OpenCV not installed, using PIL for image decoding.")
+        print("Install it with: pip install opencv-python")
+
     try:
         # Create deduplicator
         deduplicator = ImageDeduplicator(
             threshold=args.threshold,
-            dry_run=not args.no_dry_run
+            dry_run=not args.no_dry_run,
+            workers=args.jobs,
+            use_opencv=args.opencv,
+            cache_path=HASH_CACHE_PATH if args.cache else None
         )
         
         # Scan for duplicates
         print("Starting duplicate detection...")
-        duplicates = deduplicator.find_duplicates(args.directory)
+        try:
+            duplicates = deduplicator.find_duplicates(args.directory)
+        finally:
+            deduplicator.close()
         
         # Print results
         deduplicator.print_results()
@@ -2628,8 +3949,7 @@ Examples:
                 }
             }
             
-            with open(args.output, 'w') as f:
-                json.dump(output_data, f, indent=2)
+            _write_json(output_data, args.output)
             print(f"\nResults saved to: {args.output}")
         
         # Ask for deletion if not dry run
@@ -2655,5 +3975,7 @@ Examples:
 
 
 if __name__ == "__main__":
+    # Required for process-pool hashing in frozen Windows executables
+    multiprocessing.freeze_support()
     main()
 